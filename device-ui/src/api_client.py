@@ -21,10 +21,35 @@ from config import (
     API_TIMEOUT,
     WS_RECONNECT_DELAY,
     WS_MAX_RECONNECT_ATTEMPTS,
+    SIGNAL_BARS,
 )
 
 logger = logging.getLogger(__name__)
 
+_GIB = 1 << 30
+
+# device-info fields the /api/system/status fallback has no source for;
+# device_name is user-editable so it is not in here
+_STATIC_INFO_KEYS = ('firmware_version', 'serial_number', 'model')
+
+
+def add_display_fields(info: Dict) -> Dict:
+    """
+    Attach the pre-formatted strings screens show verbatim, so the Kivy
+    thread only assigns label text (runs on the async loop thread).
+    """
+    su = info.get('storage_used', 0) / _GIB
+    st = info.get('storage_total', 1) / _GIB
+    sf = st - su
+    up_d, rem = divmod(info.get('uptime', 0), 86400)
+    sig = info.get('wifi_signal', 0)
+    info['storage_free_gb'] = sf
+    info['storage_str'] = f'{su:.0f}/{st:.0f}GB used · {sf:.0f}GB free'
+    info['storage_short'] = f'{su:.0f}/{st:.0f}GB ({sf:.0f}GB free)'
+    info['uptime_str'] = f'{up_d}d {rem // 3600}h'
+    info['wifi_bars'] = SIGNAL_BARS[min(max(sig, 0) // 25, 4)]
+    return info
+
 
 class BackendClient:
     """
@@ -57,6 +82,8 @@ class BackendClient:
         self.client = httpx.AsyncClient(timeout=API_TIMEOUT)
         self.ws_connection = None
         self._ws_reconnect_attempts = 0
+        # Static device-info fields from the last successful fetch
+        self._static_info: Dict = {}
 
     async def close(self):
         await self.client.aclose()
@@ -339,12 +366,19 @@ class BackendClient:
         GET /api/system/device-info
         Returns device-level info (name, firmware, WiFi, storage, uptime).
         Falls back to /api/system/status if device-info not available.
+        Adds display strings via add_display_fields().
+
+        Firmware, serial and model from the last device-info response are
+        kept so the fallback can report them instead of placeholders.
         """
         try:
             resp = await self.client.get(
                 f"{self.base_url}/api/system/device-info")
             resp.raise_for_status()
-            return resp.json()
+            info = resp.json()
+            self._static_info = {
+                k: info[k] for k in _STATIC_INFO_KEYS if k in info}
+            return add_display_fields(info)
         except httpx.HTTPStatusError:
             # Fallback: use /api/system/status and normalise
             try:
@@ -352,17 +386,18 @@ class BackendClient:
                     f"{self.base_url}/api/system/status")
                 resp2.raise_for_status()
                 raw = resp2.json().get('system', {})
-                return {
+                return add_display_fields({
                     'device_name': 'MeetingBox',
                     'firmware_version': '1.0.0',
+                    **self._static_info,
                     'ip_address': '',
                     'wifi_ssid': '',
                     'wifi_signal': 0,
-                    'storage_used': int(raw.get('disk_used_gb', 0) * (1024**3)),
-                    'storage_total': int(raw.get('disk_total_gb', 1) * (1024**3)),
+                    'storage_used': int(raw.get('disk_used_gb', 0) * _GIB),
+                    'storage_total': int(raw.get('disk_total_gb', 1) * _GIB),
                     'uptime': 0,
                     'meetings_count': 0,
-                }
+                })
             except Exception:
                 raise
         except Exception as e:
@@ -403,7 +438,7 @@ class BackendClient:
             resp.raise_for_status()
             return resp.json()
         except Exception as e:
-            logger.error(f"Failed to scan WiFi: {e}")
+            logger.error("Failed to scan WiFi: %s", e)
             raise
 
     async def connect_wifi(self, ssid: str, password: str = None) -> Dict:
@@ -416,7 +451,7 @@ class BackendClient:
             resp.raise_for_status()
             return resp.json()
         except Exception as e:
-            logger.error(f"Failed to connect to WiFi {ssid}: {e}")
+            logger.error("Failed to connect to WiFi %s: %s", ssid, e)
             raise
 
     async def disconnect_wifi(self) -> None:
@@ -426,7 +461,7 @@ class BackendClient:
                 f"{self.base_url}/api/device/wifi/disconnect")
             resp.raise_for_status()
         except Exception as e:
-            logger.error(f"Failed to disconnect WiFi: {e}")
+            logger.error("Failed to disconnect WiFi: %s", e)
             raise
 
     # ==================================================================
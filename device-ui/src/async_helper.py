@@ -9,6 +9,8 @@ WebSocket connections) to work alongside Kivy's synchronous event loop.
 import asyncio
 import threading
 
+from kivy.clock import Clock
+
 _async_loop = None
 _async_thread = None
 
@@ -47,6 +49,37 @@ def run_async(coro):
     return None
 
 
+def run_async_then(coro, on_result=None, on_error=None):
+    """
+    Schedule *coro* on the background loop and hand its outcome back to
+    Kivy's main thread: on_result(result), or on_error(exc) if it raised.
+    Exceptions are dropped when on_error is None; cancellation is silent.
+
+    Saves wrapping a single await in an extra coroutine just to call
+    Clock.schedule_once.
+
+    Returns:
+        concurrent.futures.Future (cancellable), or None if the loop is down
+    """
+    future = run_async(coro)
+    if future is None:
+        return None
+
+    def _done(f):
+        if f.cancelled():
+            return
+        exc = f.exception()
+        if exc is None:
+            if on_result is not None:
+                result = f.result()
+                Clock.schedule_once(lambda _dt: on_result(result), 0)
+        elif on_error is not None:
+            Clock.schedule_once(lambda _dt: on_error(exc), 0)
+
+    future.add_done_callback(_done)
+    return future
+
+
 def get_async_loop():
     """Get the background asyncio event loop"""
     return _async_loop
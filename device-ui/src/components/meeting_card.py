@@ -77,8 +77,10 @@ class MeetingCard(ButtonBehavior, BoxLayout):
             self.add_widget(pa)
 
     def _format_meta(self) -> str:
-        start = datetime.fromisoformat(
-            self.meeting['start_time'].replace('Z', '+00:00'))
+        start = self.meeting.get('_start_dt')
+        if start is None:
+            start = datetime.fromisoformat(
+                self.meeting['start_time'].replace('Z', '+00:00'))
         now = datetime.now(start.tzinfo)
         delta = now - start
         if delta < timedelta(hours=1):
@@ -87,9 +89,11 @@ class MeetingCard(ButtonBehavior, BoxLayout):
             ago = f"{int(delta.total_seconds() / 3600)} hr ago"
         else:
             ago = f"{delta.days} days ago"
-        dur = self.meeting.get('duration', 0)
-        if dur:
-            return f"{ago} · {dur // 60} min"
+        dur = self.meeting.get('_dur_min')
+        if dur is None:
+            dur = self.meeting.get('duration', 0) // 60
+        if self.meeting.get('duration', 0):
+            return f"{ago} · {dur} min"
         return ago
 
     def on_press(self):
@@ -9,7 +9,7 @@ from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.widget import Widget
-from kivy.graphics import Color, Rectangle, RoundedRectangle
+from kivy.graphics import Color, Line, Rectangle, RoundedRectangle
 
 from config import COLORS, FONT_SIZES, BORDER_RADIUS, SPACING
 from components.button import PrimaryButton, SecondaryButton, DangerButton
@@ -69,7 +69,6 @@ class ModalDialog(FloatLayout):
                 pos=card.pos, size=card.size, radius=[BORDER_RADIUS])
             if border_color:
                 Color(*border_color)
-                from kivy.graphics import Line
                 Line(rounded_rectangle=(
                     card.x, card.y, card.width, card.height, BORDER_RADIUS),
                     width=2)
@@ -11,7 +11,9 @@ Supports three modes:
 from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
+from kivy.uix.widget import Widget
 from kivy.graphics import Color, RoundedRectangle
+from ui_helper import WrapLabel
 from config import COLORS, FONT_SIZES, SPACING, BORDER_RADIUS
 from components.toggle_switch import ToggleSwitch
 
@@ -28,11 +30,13 @@ class SettingsItem(ButtonBehavior, BoxLayout):
     active      : bool  – initial toggle state (toggle mode)
     on_press    : callable
     on_toggle   : callable(bool) – for toggle mode
+    target_screen : str – screen an arrow row opens (read by on_press)
     """
 
     def __init__(self, title: str, subtitle: str = '',
                  mode: str = 'arrow', active: bool = False,
-                 on_press=None, on_toggle=None, **kwargs):
+                 on_press=None, on_toggle=None, target_screen=None,
+                 **kwargs):
 
         kwargs.setdefault('orientation', 'horizontal')
         kwargs.setdefault('size_hint_y', None)
@@ -43,6 +47,7 @@ class SettingsItem(ButtonBehavior, BoxLayout):
         super().__init__(**kwargs)
 
         self._mode = mode
+        self.target_screen = target_screen
         if on_press and mode == 'arrow':
             self.bind(on_press=on_press)
 
@@ -63,7 +68,7 @@ class SettingsItem(ButtonBehavior, BoxLayout):
             spacing=2,
         )
 
-        self.title_label = Label(
+        self.title_label = WrapLabel(
             text=title,
             font_size=FONT_SIZES['small'] + 2,
             color=COLORS['white'],
@@ -71,10 +76,9 @@ class SettingsItem(ButtonBehavior, BoxLayout):
             valign='bottom',
             size_hint=(1, 0.5),
         )
-        self.title_label.bind(size=self.title_label.setter('text_size'))
         text_box.add_widget(self.title_label)
 
-        self.subtitle_label = Label(
+        self.subtitle_label = WrapLabel(
             text=subtitle,
             font_size=FONT_SIZES['small'],
             color=COLORS['gray_500'],
@@ -82,7 +86,6 @@ class SettingsItem(ButtonBehavior, BoxLayout):
             valign='top',
             size_hint=(1, 0.5),
         )
-        self.subtitle_label.bind(size=self.subtitle_label.setter('text_size'))
         text_box.add_widget(self.subtitle_label)
 
         self.add_widget(text_box)
@@ -107,7 +110,6 @@ class SettingsItem(ButtonBehavior, BoxLayout):
             self.add_widget(self.toggle)
         else:
             # info – no indicator
-            from kivy.uix.widget import Widget
             self.add_widget(Widget(size_hint=(0.1, 1)))
 
     # Press feedback
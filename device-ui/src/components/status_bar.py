@@ -15,6 +15,7 @@ from kivy.graphics import Color, Rectangle, Line
 from kivy.animation import Animation
 from kivy.app import App
 
+from ui_helper import set_text, set_color
 from config import COLORS, FONT_SIZES, STATUS_BAR_HEIGHT
 
 
@@ -194,6 +195,16 @@ class StatusBar(BoxLayout):
             self.status_dot.opacity = 1
 
     # -- public properties ----------------------------------------------
+    # Screens re-apply these on every enter; the setters skip unchanged
+    # values so a re-entry doesn't re-render the bar's labels
+
+    @property
+    def device_name(self):
+        return self.device_label.text
+
+    @device_name.setter
+    def device_name(self, value):
+        set_text(self.device_label, value)
 
     @property
     def status_text(self):
@@ -202,7 +213,7 @@ class StatusBar(BoxLayout):
     @status_text.setter
     def status_text(self, value):
         if hasattr(self, 'status_label'):
-            self.status_label.text = value
+            set_text(self.status_label, value)
 
     @property
     def status_color(self):
@@ -212,4 +223,4 @@ class StatusBar(BoxLayout):
     def status_color(self, value):
         self._status_color = value
         if hasattr(self, 'status_dot'):
-            self.status_dot.color = value
+            set_color(self.status_dot, value)
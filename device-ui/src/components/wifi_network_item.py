@@ -8,7 +8,8 @@ from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.graphics import Color, RoundedRectangle
-from config import COLORS, FONT_SIZES, SPACING, BORDER_RADIUS
+from ui_helper import set_text
+from config import COLORS, FONT_SIZES, SPACING, BORDER_RADIUS, SIGNAL_BARS
 
 
 class WiFiNetworkItem(ButtonBehavior, BoxLayout):
@@ -39,38 +40,47 @@ class WiFiNetworkItem(ButtonBehavior, BoxLayout):
         )
 
         # SSID
-        ssid = Label(
-            text=network['ssid'],
+        self._ssid_label = Label(
             font_size=FONT_SIZES['medium'],
             color=COLORS['white'],
-            bold=network.get('connected', False),
             halign='left',
             size_hint=(0.65, 1),
         )
-        ssid.bind(size=ssid.setter('text_size'))
-        self.add_widget(ssid)
+        self._ssid_label.bind(size=self._ssid_label.setter('text_size'))
+        self.add_widget(self._ssid_label)
 
         # Signal
-        sig = network.get('signal_strength', 0)
-        bars = '▂▄▆█'[:max(1, sig // 25)]
-        sig_color = COLORS['blue'] if network.get('connected') else COLORS['gray_500']
-        sig_label = Label(
-            text=bars,
+        self._sig_label = Label(
             font_size=FONT_SIZES['medium'],
-            color=sig_color,
             size_hint=(0.2, 1),
         )
-        self.add_widget(sig_label)
-
-        # Connected
-        if network.get('connected'):
-            ok = Label(
-                text='✓',
-                font_size=FONT_SIZES['medium'],
-                color=COLORS['green'],
-                size_hint=(0.15, 1),
-            )
-            self.add_widget(ok)
+        self.add_widget(self._sig_label)
+
+        # Connected (only in the row while connected)
+        self._ok_label = Label(
+            text='✓',
+            font_size=FONT_SIZES['medium'],
+            color=COLORS['green'],
+            size_hint=(0.15, 1),
+        )
+
+        self.set_network(network)
+
+    def set_network(self, network: dict):
+        """Refresh the row in place for a new scan result."""
+        self.network = network
+        connected = network.get('connected', False)
+        set_text(self._ssid_label, network['ssid'])
+        self._ssid_label.bold = connected
+
+        sig = network.get('signal_strength', 0)
+        set_text(self._sig_label, SIGNAL_BARS[min(max(sig, 0) // 25, 4)])
+        self._sig_label.color = COLORS['blue'] if connected else COLORS['gray_500']
+
+        if connected and self._ok_label.parent is None:
+            self.add_widget(self._ok_label)
+        elif not connected and self._ok_label.parent is not None:
+            self.remove_widget(self._ok_label)
 
     def on_press(self):
         if not self.network.get('connected'):
@@ -24,6 +24,16 @@ USE_MOCK_BACKEND = os.getenv('MOCK_BACKEND', '0') == '1'
 # API timeout in seconds
 API_TIMEOUT = 30
 
+# Give up on a screen's initial data load after this long (seconds)
+SCREEN_LOAD_TIMEOUT = 5
+
+# Reuse a fetched system info response for this long (seconds)
+SYSTEM_INFO_CACHE_TTL = 30
+# Shorter limit for screens that show uptime / WiFi signal
+SYSTEM_INFO_FRESH_TTL = 5
+# Re-entering Check for Updates within this many seconds reuses the result
+UPDATE_CHECK_TTL = 30
+
 # WebSocket reconnect settings
 WS_RECONNECT_DELAY = 3  # seconds
 WS_MAX_RECONNECT_ATTEMPTS = 10
@@ -125,11 +135,19 @@ SPACING = {
     'section_spacing': 20,
     'list_item_spacing': 8,
 }
+# Flat aliases for layout code
+SCREEN_PADDING = SPACING['screen_padding']
+BUTTON_SPACING = SPACING['button_spacing']
+SECTION_SPACING = SPACING['section_spacing']
+LIST_ITEM_SPACING = SPACING['list_item_spacing']
 
 # More rounded corners (Apple style)
 BORDER_RADIUS = 14
 
 # Layout constants
+# WiFi signal bars indexed by min(signal // 25, 4) (0-100 %); at least one bar
+SIGNAL_BARS = ('▂', '▂', '▂▄', '▂▄▆', '▂▄▆█')
+
 STATUS_BAR_HEIGHT = 44
 FOOTER_HEIGHT = 20
 CONTENT_PADDING_H = 16
@@ -225,6 +243,8 @@ BASE_DIR = Path(__file__).parent.parent.resolve()
 ASSETS_DIR = BASE_DIR / 'assets'
 FONTS_DIR = ASSETS_DIR / 'fonts'
 ICONS_DIR = ASSETS_DIR / 'icons'
+# Generated artefacts that survive reboots (e.g. the setup QR code)
+CACHE_DIR = Path(os.getenv('CACHE_DIR', '/var/cache/meetingbox'))
 
 try:
     ASSETS_DIR.mkdir(exist_ok=True)
@@ -10,6 +10,7 @@ import asyncio
 import logging
 import os
 import sys
+import time
 from pathlib import Path
 
 # Ensure the directory containing this file (src) is on sys.path so that
@@ -58,6 +59,7 @@ from config import (
     SHOW_FPS,
     TRANSITION_DURATION,
     DEFAULT_PRIVACY_MODE,
+    SYSTEM_INFO_CACHE_TTL,
 )
 
 from api_client import BackendClient
@@ -120,6 +122,26 @@ logger = logging.getLogger(__name__)
 # Import async helper (starts background loop on import)
 from async_helper import run_async, get_async_loop
 
+# Optional: event-driven wait for the setup marker (Linux only)
+try:
+    from asyncinotify import Inotify, Mask
+    HAS_INOTIFY = True
+except ImportError:
+    HAS_INOTIFY = False
+
+# Shared config volume (mounted at /data/config in Docker, falls back to
+# /opt/meetingbox for bare-metal installs)
+SETUP_MARKER_PATHS = (
+    '/data/config/.setup_complete',
+    '/opt/meetingbox/data/config/.setup_complete',
+    '/opt/meetingbox/.setup_complete',
+)
+
+# Seconds between marker checks: polling alone, or as a backstop next to
+# the inotify watch, which misses markers whose directory appears later
+SETUP_POLL_INTERVAL = 3.0
+SETUP_BACKSTOP_INTERVAL = 15.0
+
 
 # ==================================================================
 # Application
@@ -159,9 +181,16 @@ class MeetingBoxApp(App):
         self.device_name = 'MeetingBox'
         self.auto_record = False
 
+        # Last backend system info + monotonic fetch time
+        self._system_info = None
+        self._system_info_ts = 0.0
+        self._system_info_task = None
+
         # Screen manager & nav stack
         self.screen_manager = None
         self._nav_stack = []
+        # kind -> Transition, filled by _set_transition
+        self._transitions = {}
 
         # WebSocket
         self.ws_task = None
@@ -188,8 +217,10 @@ class MeetingBoxApp(App):
             Window.show_cursor = False
 
         # Screen manager – default to fade transition
+        self._transitions['fade'] = FadeTransition(
+            duration=TRANSITION_DURATION['fade'])
         self.screen_manager = ScreenManager(
-            transition=FadeTransition(duration=TRANSITION_DURATION['fade']))
+            transition=self._transitions['fade'])
 
         # Register ALL screens
         self.screen_manager.add_widget(SplashScreen(name='splash'))
@@ -239,13 +270,7 @@ class MeetingBoxApp(App):
     def needs_setup(self) -> bool:
         if USE_MOCK_BACKEND:
             return False
-        # Check shared config volume (mounted at /data/config in Docker,
-        # falls back to /opt/meetingbox for bare-metal installs)
-        for marker_path in [
-            '/data/config/.setup_complete',
-            '/opt/meetingbox/data/config/.setup_complete',
-            '/opt/meetingbox/.setup_complete',
-        ]:
+        for marker_path in SETUP_MARKER_PATHS:
             if Path(marker_path).exists():
                 return False
         return True
@@ -257,10 +282,43 @@ class MeetingBoxApp(App):
     def on_start(self):
         logger.info("MeetingBox UI started")
         Clock.schedule_once(self._check_backend, 2.0)
+        self._setup_poll = None
+        self._setup_watch = None
         if self.needs_setup():
-            self._setup_poll = Clock.schedule_interval(self._global_setup_check, 3.0)
-        else:
-            self._setup_poll = None
+            if HAS_INOTIFY:
+                self._setup_watch = run_async(self._watch_setup_marker())
+                self._start_setup_poll(interval=SETUP_BACKSTOP_INTERVAL)
+            else:
+                self._start_setup_poll()
+
+    def _start_setup_poll(self, _dt=None, interval=SETUP_POLL_INTERVAL):
+        if self._setup_poll:
+            self._setup_poll.cancel()
+        self._setup_poll = Clock.schedule_interval(
+            self._global_setup_check, interval)
+
+    async def _watch_setup_marker(self):
+        """Block on inotify until the setup marker is created."""
+        try:
+            with Inotify() as inotify:
+                watched = 0
+                for marker_path in SETUP_MARKER_PATHS:
+                    parent = Path(marker_path).parent
+                    if parent.is_dir():
+                        inotify.add_watch(parent, Mask.CREATE | Mask.MOVED_TO)
+                        watched += 1
+                if not watched:
+                    raise FileNotFoundError('no marker directory to watch')
+                # The marker may have landed before the watches were added
+                if self.needs_setup():
+                    async for event in inotify:
+                        if event.name and Path(event.name).name == '.setup_complete':
+                            break
+        except Exception as e:
+            logger.warning("Setup marker watch unavailable (%s), polling", e)
+            Clock.schedule_once(self._start_setup_poll, 0)
+            return
+        Clock.schedule_once(self._global_setup_check, 0)
 
     def _global_setup_check(self, _dt):
         """Global poll for setup_complete marker -- fires from any screen."""
@@ -268,6 +326,9 @@ class MeetingBoxApp(App):
             if self._setup_poll:
                 self._setup_poll.cancel()
                 self._setup_poll = None
+            if self._setup_watch:
+                self._setup_watch.cancel()
+                self._setup_watch = None
             onboarding_screens = {'welcome', 'wifi_setup', 'setup_progress'}
             current = self.screen_manager.current
             if current in onboarding_screens:
@@ -277,6 +338,8 @@ class MeetingBoxApp(App):
         logger.info("MeetingBox UI stopping")
         if getattr(self, '_setup_poll', None):
             self._setup_poll.cancel()
+        if getattr(self, '_setup_watch', None):
+            self._setup_watch.cancel()
         if self.ws_task and not self.ws_task.done():
             self.ws_task.cancel()
         run_async(self.backend.close())
@@ -305,6 +368,43 @@ class MeetingBoxApp(App):
                 logger.warning("Could not load settings: %s", e)
         run_async(_health())
 
+    # ==================================================================
+    # SYSTEM INFO CACHE
+    # ==================================================================
+
+    def get_cached_system_info(self, max_age=SYSTEM_INFO_CACHE_TTL):
+        """Return the cached system info if younger than *max_age* s, else None."""
+        if (self._system_info is not None
+                and time.monotonic() - self._system_info_ts < max_age):
+            return self._system_info
+        return None
+
+    def invalidate_system_info(self):
+        """Force the next get_system_info() call to hit the backend."""
+        self._system_info_ts = 0.0
+
+    async def get_system_info(self, max_age=SYSTEM_INFO_CACHE_TTL):
+        """Return backend system info, reusing a result younger than *max_age* s."""
+        cached = self.get_cached_system_info(max_age)
+        if cached is not None:
+            return cached
+        # Screens entered back to back share one in-flight request
+        if self._system_info_task is None:
+            self._system_info_task = asyncio.ensure_future(
+                self._fetch_system_info())
+        # Shield so a caller cancelled on screen leave doesn't abort the
+        # request for everyone else waiting on it
+        return await asyncio.shield(self._system_info_task)
+
+    async def _fetch_system_info(self):
+        try:
+            info = await self.backend.get_system_info()
+            self._system_info = info
+            self._system_info_ts = time.monotonic()
+            return info
+        finally:
+            self._system_info_task = None
+
     # ==================================================================
     # NAVIGATION (with history stack & transitions)
     # ==================================================================
@@ -353,19 +453,21 @@ class MeetingBoxApp(App):
             self.goto_screen('home', transition='fade')
 
     def _set_transition(self, kind):
-        dur = TRANSITION_DURATION.get('fade', 0.3)
-        if kind == 'fade':
-            self.screen_manager.transition = FadeTransition(duration=dur)
-        elif kind == 'slide_left':
-            self.screen_manager.transition = SlideTransition(
-                direction='left', duration=dur)
-        elif kind == 'slide_right':
-            self.screen_manager.transition = SlideTransition(
-                direction='right', duration=dur)
-        elif kind == 'none':
-            self.screen_manager.transition = NoTransition()
-        else:
-            self.screen_manager.transition = FadeTransition(duration=dur)
+        # One instance per kind, reused for every navigation
+        transition = self._transitions.get(kind)
+        if transition is None:
+            dur = TRANSITION_DURATION.get('fade', 0.3)
+            if kind == 'slide_left':
+                transition = SlideTransition(direction='left', duration=dur)
+            elif kind == 'slide_right':
+                transition = SlideTransition(direction='right', duration=dur)
+            elif kind == 'none':
+                transition = NoTransition()
+            else:
+                kind = 'fade'
+                transition = self._transitions.get(kind) or FadeTransition(duration=dur)
+            self._transitions[kind] = transition
+        self.screen_manager.transition = transition
 
     # ==================================================================
     # WEBSOCKET EVENT HANDLING
@@ -11,6 +11,8 @@ from typing import List, Dict, Optional, AsyncIterator
 from datetime import datetime, timedelta
 import random
 
+from api_client import add_display_fields
+
 logger = logging.getLogger(__name__)
 
 
@@ -206,7 +208,7 @@ class MockBackendClient:
 
     async def get_system_info(self) -> Dict:
         await asyncio.sleep(0.2)
-        return {
+        return add_display_fields({
             "device_name": self._settings.get('device_name', 'Conference Room A'),
             "serial_number": "MB-2026-00001234",
             "firmware_version": "1.2.5",
@@ -217,7 +219,7 @@ class MockBackendClient:
             "storage_total": 512_000_000_000,
             "uptime": 172800,
             "meetings_count": len(self.meetings),
-        }
+        })
 
     async def check_for_updates(self) -> Dict:
         await asyncio.sleep(1.5)
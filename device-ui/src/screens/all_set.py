@@ -8,22 +8,14 @@ Duration: 10 seconds (auto-advance) or tap to skip.
 
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
-from kivy.uix.image import Image
 from kivy.uix.widget import Widget
 from kivy.animation import Animation
 from kivy.clock import Clock
+from ui_helper import qr_image
 
 from screens.base_screen import BaseScreen
 from config import COLORS, FONT_SIZES, DASHBOARD_URL, ALL_SET_DURATION
 
-try:
-    import qrcode
-    from io import BytesIO
-    from kivy.core.image import Image as CoreImage
-    HAS_QRCODE = True
-except ImportError:
-    HAS_QRCODE = False
-
 
 class AllSetScreen(BaseScreen):
     """You're All Set -- post-setup success screen with dashboard URL."""
@@ -160,19 +152,9 @@ class AllSetScreen(BaseScreen):
 
     def _generate_qr(self, url: str):
         """Generate a small QR code image widget."""
-        if HAS_QRCODE:
-            try:
-                qr = qrcode.QRCode(version=1, box_size=4, border=1)
-                qr.add_data(url)
-                qr.make(fit=True)
-                img = qr.make_image(fill_color='white', back_color='black')
-                buf = BytesIO()
-                img.save(buf, format='PNG')
-                buf.seek(0)
-                core_img = CoreImage(buf, ext='png')
-                return Image(texture=core_img.texture, size_hint=(1, 1))
-            except Exception:
-                pass
+        img = qr_image(url, box_size=4)
+        if img is not None:
+            return img
         return Label(
             text='[QR]',
             font_size=FONT_SIZES['small'],
@@ -15,6 +15,7 @@ from kivy.graphics import Color, Rectangle
 from kivy.app import App
 
 from config import COLORS, FONT_SIZES, SPACING, FOOTER_HEIGHT, DISPLAY_WIDTH
+from ui_helper import set_text
 
 
 class BaseScreen(Screen):
@@ -29,8 +30,13 @@ class BaseScreen(Screen):
     - Lifecycle hooks
     """
 
+    # Rarely visited screens set this and skip _build_ui() in __init__;
+    # their widgets are then built on first on_pre_enter
+    LAZY_UI = False
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self._ui_built = not self.LAZY_UI
 
     @property
     def app(self):
@@ -56,6 +62,10 @@ class BaseScreen(Screen):
     # Helpers
     # ------------------------------------------------------------------
 
+    def _is_current(self):
+        """True while this screen is the one being shown."""
+        return self.manager is not None and self.manager.current == self.name
+
     def make_dark_bg(self, widget):
         """Attach a dark background rectangle to *widget*."""
         with widget.canvas.before:
@@ -127,14 +137,20 @@ class BaseScreen(Screen):
             return
         wifi = '✓' if wifi_ok else '✗'
         if privacy_mode:
-            self._footer_left.text = f'Local Mode   Storage: {free_gb:.0f}GB free'
+            text = f'Local Mode   Storage: {free_gb:.0f}GB free'
         else:
-            self._footer_left.text = f'WiFi: {wifi}   Storage: {free_gb:.0f}GB free'
+            text = f'WiFi: {wifi}   Storage: {free_gb:.0f}GB free'
+        set_text(self._footer_left, text)
 
     # ------------------------------------------------------------------
     # Lifecycle hooks (override in subclasses)
     # ------------------------------------------------------------------
 
+    def on_pre_enter(self):
+        if not self._ui_built:
+            self._build_ui()
+            self._ui_built = True
+
     def on_enter(self):
         pass
 
@@ -139,7 +139,7 @@ class CompleteScreen(BaseScreen):
 
     # ------------------------------------------------------------------
     def on_enter(self):
-        self.status_bar.device_label.text = getattr(self.app, 'device_name', 'MeetingBox')
+        self.status_bar.device_name = getattr(self.app, 'device_name', 'MeetingBox')
 
         # Checkmark spring-in
         self.check_label.opacity = 0
@@ -110,7 +110,7 @@ class HomeScreen(BaseScreen):
     # Lifecycle
     # ------------------------------------------------------------------
     def on_enter(self):
-        self.status_bar.device_label.text = getattr(self.app, 'device_name', 'MeetingBox')
+        self.status_bar.device_name = getattr(self.app, 'device_name', 'MeetingBox')
         self._load_last_meeting()
         self._load_system_status()
         self._apply_privacy_mode()
@@ -171,8 +171,8 @@ class HomeScreen(BaseScreen):
     def _load_system_status(self):
         async def _fetch():
             try:
-                info = await self.backend.get_system_info()
-                free_gb = (info['storage_total'] - info['storage_used']) / (1024 ** 3)
+                info = await self.app.get_system_info()
+                free_gb = info['storage_free_gb']
                 wifi_ok = bool(info.get('wifi_ssid'))
                 privacy = getattr(self.app, 'privacy_mode', False)
                 Clock.schedule_once(
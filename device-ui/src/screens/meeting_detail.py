@@ -4,6 +4,7 @@ Meeting Detail Screen – Dark themed (480 × 320)
 Scrollable detail view with summary, action items, decisions.
 """
 
+import asyncio
 from datetime import datetime
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.scrollview import ScrollView
@@ -16,7 +17,10 @@ from screens.base_screen import BaseScreen
 from components.status_bar import StatusBar
 from components.button import SecondaryButton, DangerButton
 from components.action_item import ActionItemWidget
-from config import COLORS, FONT_SIZES, SPACING
+from config import COLORS, FONT_SIZES, SPACING, SCREEN_LOAD_TIMEOUT
+
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
 
 
 class MeetingDetailScreen(BaseScreen):
@@ -26,6 +30,7 @@ class MeetingDetailScreen(BaseScreen):
         super().__init__(**kwargs)
         self.meeting_id = None
         self.meeting = None
+        self._load_task = None
         self._build_ui()
 
     def _build_ui(self):
@@ -69,19 +74,25 @@ class MeetingDetailScreen(BaseScreen):
         self.meta_label.bind(size=self.meta_label.setter('text_size'))
         self.content.add_widget(self.meta_label)
 
-        self.summary_container = BoxLayout(
-            orientation='vertical', size_hint_y=None,
+        self.summary_container = GridLayout(
+            cols=1, size_hint_y=None,
             spacing=SPACING['button_spacing'])
+        self.summary_container.bind(
+            minimum_height=self.summary_container.setter('height'))
         self.content.add_widget(self.summary_container)
 
-        self.actions_container = BoxLayout(
-            orientation='vertical', size_hint_y=None,
+        self.actions_container = GridLayout(
+            cols=1, size_hint_y=None,
             spacing=SPACING['button_spacing'])
+        self.actions_container.bind(
+            minimum_height=self.actions_container.setter('height'))
         self.content.add_widget(self.actions_container)
 
-        self.decisions_container = BoxLayout(
-            orientation='vertical', size_hint_y=None,
+        self.decisions_container = GridLayout(
+            cols=1, size_hint_y=None,
             spacing=SPACING['button_spacing'])
+        self.decisions_container.bind(
+            minimum_height=self.decisions_container.setter('height'))
         self.content.add_widget(self.decisions_container)
 
         buttons = BoxLayout(
@@ -109,15 +120,24 @@ class MeetingDetailScreen(BaseScreen):
         if self.meeting_id:
             self._load_meeting()
 
+    def on_leave(self):
+        if self._load_task:
+            self._load_task.cancel()
+            self._load_task = None
+
     def _load_meeting(self):
         async def _load():
             try:
-                meeting = await self.backend.get_meeting_detail(self.meeting_id)
+                meeting = await asyncio.wait_for(
+                    self.backend.get_meeting_detail(self.meeting_id),
+                    timeout=SCREEN_LOAD_TIMEOUT)
                 self.meeting = meeting
-                Clock.schedule_once(lambda _: self._populate(), 0)
+                Clock.schedule_once(
+                    lambda _: self._is_current() and self._populate(), 0)
             except Exception:
-                Clock.schedule_once(lambda _: self.go_back(), 0)
-        run_async(_load())
+                Clock.schedule_once(
+                    lambda _: self._is_current() and self.go_back(), 0)
+        self._load_task = run_async(_load())
 
     def _populate(self):
         if not self.meeting:
@@ -126,65 +146,47 @@ class MeetingDetailScreen(BaseScreen):
         start = datetime.fromisoformat(
             self.meeting['start_time'].replace('Z', '+00:00'))
         dur = self.meeting.get('duration', 0) // 60
-        self.meta_label.text = f"{start.strftime('%b %d, %I:%M %p')} · {dur}min"
-
-        summary = self.meeting.get('summary', {})
-        self._populate_summary(summary)
-        self._populate_actions(summary.get('action_items', []))
-        self._populate_decisions(summary.get('decisions', []))
-
-    def _populate_summary(self, summary):
-        self.summary_container.clear_widgets()
-        h = Label(text='Summary', font_size=FONT_SIZES['medium'],
-                  size_hint_y=None, height=20, color=COLORS['white'],
-                  bold=True, halign='left')
-        h.bind(size=h.setter('text_size'))
-        self.summary_container.add_widget(h)
-        t = Label(text=summary.get('summary', 'No summary'),
-                  font_size=FONT_SIZES['small'], size_hint_y=None,
-                  color=COLORS['gray_400'], halign='left', valign='top')
-        t.bind(texture_size=t.setter('size'))
-        t.bind(size=t.setter('text_size'))
-        self.summary_container.add_widget(t)
-        self.summary_container.height = 20 + t.height + SPACING['button_spacing']
-
-    def _populate_actions(self, items):
-        self.actions_container.clear_widgets()
-        if not items:
-            return
-        h = Label(text=f'Actions ({len(items)})',
-                  font_size=FONT_SIZES['medium'],
-                  size_hint_y=None, height=20, color=COLORS['white'],
-                  bold=True, halign='left')
-        h.bind(size=h.setter('text_size'))
-        self.actions_container.add_widget(h)
-        total = 20
-        for item in items:
-            w = ActionItemWidget(action_item=item)
-            self.actions_container.add_widget(w)
-            total += w.height + SPACING['button_spacing']
-        self.actions_container.height = total
-
-    def _populate_decisions(self, decisions):
-        self.decisions_container.clear_widgets()
-        if not decisions:
-            return
-        h = Label(text=f'Decisions ({len(decisions)})',
-                  font_size=FONT_SIZES['medium'],
-                  size_hint_y=None, height=20, color=COLORS['white'],
-                  bold=True, halign='left')
-        h.bind(size=h.setter('text_size'))
-        self.decisions_container.add_widget(h)
-        total = 20
-        for d in decisions:
-            dl = Label(text=f'• {d}', font_size=FONT_SIZES['small'],
-                       size_hint_y=None, color=COLORS['gray_400'],
-                       halign='left', valign='top')
-            dl.bind(texture_size=dl.setter('size'))
-            dl.bind(size=dl.setter('text_size'))
-            self.decisions_container.add_widget(dl)
-            total += dl.height + SPACING['button_spacing']
-        self.decisions_container.height = total
+        # Same output as strftime('%b %d, %I:%M %p') without the locale path
+        hour12 = (start.hour - 1) % 12 + 1
+        ampm = 'AM' if start.hour < 12 else 'PM'
+        self.meta_label.text = (
+            f"{_MONTHS[start.month - 1]} {start.day:02d}, "
+            f"{hour12:02d}:{start.minute:02d} {ampm} · {dur}min")
+
+        self._populate_sections(self.meeting.get('summary', {}))
+
+    def _populate_sections(self, summary):
+        """Fill the summary / actions / decisions containers in one pass."""
+        actions = summary.get('action_items', [])
+        decisions = summary.get('decisions', [])
+        # (container, header, rows, rows are action items, show when empty)
+        sections = (
+            (self.summary_container, 'Summary',
+             [summary.get('summary', 'No summary')], False, True),
+            (self.actions_container, f'Actions ({len(actions)})',
+             actions, True, False),
+            (self.decisions_container, f'Decisions ({len(decisions)})',
+             [f'• {d}' for d in decisions], False, False),
+        )
+        for container, header, rows, is_action, always in sections:
+            container.clear_widgets()
+            if not rows and not always:
+                continue
+            h = Label(text=header, font_size=FONT_SIZES['medium'],
+                      size_hint_y=None, height=20, color=COLORS['white'],
+                      bold=True, halign='left')
+            h.bind(size=h.setter('text_size'))
+            container.add_widget(h)
+            for row in rows:
+                if is_action:
+                    w = ActionItemWidget(action_item=row)
+                else:
+                    w = Label(text=row, font_size=FONT_SIZES['small'],
+                              size_hint_y=None, color=COLORS['gray_400'],
+                              halign='left', valign='top')
+                    w.bind(texture_size=w.setter('size'))
+                    w.bind(size=w.setter('text_size'))
+                container.add_widget(w)
 
     def _on_delete(self, _inst):
         async def _delete():
@@ -4,6 +4,7 @@ Meetings List Screen – Dark themed (480 × 320)
 Scrollable list of past meetings.
 """
 
+import asyncio
 from datetime import datetime, timedelta
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.scrollview import ScrollView
@@ -15,7 +16,8 @@ from async_helper import run_async
 from screens.base_screen import BaseScreen
 from components.status_bar import StatusBar
 from components.meeting_card import MeetingCard
-from config import COLORS, FONT_SIZES, SPACING, MEETINGS_LIST_LIMIT
+from config import (COLORS, FONT_SIZES, SPACING, MEETINGS_LIST_LIMIT,
+                    SCREEN_LOAD_TIMEOUT)
 
 
 class MeetingsScreen(BaseScreen):
@@ -24,6 +26,7 @@ class MeetingsScreen(BaseScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.meetings = []
+        self._load_task = None
         self._build_ui()
 
     def _build_ui(self):
@@ -60,15 +63,28 @@ class MeetingsScreen(BaseScreen):
     def on_enter(self):
         self._load_meetings()
 
+    def on_leave(self):
+        if self._load_task:
+            self._load_task.cancel()
+            self._load_task = None
+
     def _load_meetings(self):
         async def _load():
             try:
-                meetings = await self.backend.get_meetings(limit=MEETINGS_LIST_LIMIT)
+                meetings = await asyncio.wait_for(
+                    self.backend.get_meetings(limit=MEETINGS_LIST_LIMIT),
+                    timeout=SCREEN_LOAD_TIMEOUT)
+                # Parse timestamps here so the UI thread only builds widgets
+                for m in meetings:
+                    m['_start_dt'] = datetime.fromisoformat(
+                        m['start_time'].replace('Z', '+00:00'))
+                    m['_dur_min'] = m.get('duration', 0) // 60
                 self.meetings = meetings
-                Clock.schedule_once(lambda _: self._populate(), 0)
+                Clock.schedule_once(
+                    lambda _: self._is_current() and self._populate(), 0)
             except Exception:
                 pass
-        run_async(_load())
+        self._load_task = run_async(_load())
 
     def _populate(self):
         self.meetings_container.clear_widgets()
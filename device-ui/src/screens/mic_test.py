@@ -46,7 +46,16 @@ class _TestWaveform(Widget):
         kwargs.setdefault('height', 60)
         super().__init__(**kwargs)
         self._levels = [2] * self.NUM_BARS
-        self.bind(pos=self._draw, size=self._draw)
+        self._recompute_xs()
+        self.bind(pos=self._recompute_xs, size=self._recompute_xs)
+
+    def _recompute_xs(self, *_args):
+        """Cache bar x-positions; they only change with pos/size."""
+        step = self.BAR_WIDTH + self.BAR_SPACING
+        start_x = self.x + (self.width - self.NUM_BARS * step) / 2
+        self._bar_xs = [start_x + i * step for i in range(self.NUM_BARS)]
+        self._base_y = self.y + 2
+        self._draw()
 
     def set_levels(self, levels: list):
         self._levels = levels
@@ -54,14 +63,11 @@ class _TestWaveform(Widget):
 
     def _draw(self, *_args):
         self.canvas.clear()
-        total_w = self.NUM_BARS * (self.BAR_WIDTH + self.BAR_SPACING)
-        start_x = self.x + (self.width - total_w) / 2
-        base_y = self.y + 2
+        base_y = self._base_y
 
         with self.canvas:
-            for i, h in enumerate(self._levels):
+            for bx, h in zip(self._bar_xs, self._levels):
                 Color(*COLORS['blue'])
-                bx = start_x + i * (self.BAR_WIDTH + self.BAR_SPACING)
                 RoundedRectangle(
                     pos=(bx, base_y),
                     size=(self.BAR_WIDTH, max(2, h)),
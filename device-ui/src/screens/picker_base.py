@@ -36,10 +36,8 @@ class _RadioRow(ButtonBehavior, BoxLayout):
             Color(*COLORS['surface'])
             self._bg = RoundedRectangle(
                 pos=self.pos, size=self.size, radius=[BORDER_RADIUS])
-        self.bind(
-            pos=lambda w, v: setattr(self._bg, 'pos', w.pos),
-            size=lambda w, v: setattr(self._bg, 'size', w.size),
-        )
+        self.fbind('pos', self._on_geom)
+        self.fbind('size', self._on_geom)
 
         self.radio_label = Label(
             text='●' if selected else '○',
@@ -60,6 +58,10 @@ class _RadioRow(ButtonBehavior, BoxLayout):
         self.text_label.bind(size=self.text_label.setter('text_size'))
         self.add_widget(self.text_label)
 
+    def _on_geom(self, *_args):
+        self._bg.pos = self.pos
+        self._bg.size = self.size
+
     def set_selected(self, selected: bool):
         self.radio_label.text = '●' if selected else '○'
         self.radio_label.color = COLORS['blue'] if selected else COLORS['gray_500']
@@ -137,7 +137,7 @@ class ProcessingScreen(BaseScreen):
         self._eta_seconds = seconds
 
     def on_enter(self):
-        self.status_bar.device_label.text = getattr(self.app, 'device_name', 'MeetingBox')
+        self.status_bar.device_name = getattr(self.app, 'device_name', 'MeetingBox')
         privacy = getattr(self.app, 'privacy_mode', False)
         if privacy:
             self.status_bar.status_text = 'PROCESSING (Local)'
@@ -29,15 +29,36 @@ from kivy.uix.label import Label
 from kivy.uix.widget import Widget
 from kivy.graphics import Color, RoundedRectangle, Rectangle
 from kivy.clock import Clock
+from kivy.core.window import Window
 
 from screens.base_screen import BaseScreen
 from components.button import SecondaryButton, DangerButton
 from components.status_bar import StatusBar
 from config import COLORS, FONT_SIZES, SPACING, BORDER_RADIUS
-from async_helper import run_async
+from async_helper import run_async_then
+from ui_helper import set_text
 
 logger = logging.getLogger(__name__)
 
+# Zero-padded "00".."59" for the timer display
+_TWO_DIGIT = [f'{i:02d}' for i in range(60)]
+_FMT_LONG = '{:02d}:{:02d}:{:02d}'.format
+
+# Shared timer/waveform tick period (s). The waveform redraws on every
+# tick (8 Hz); the timer advances once per accumulated second.
+TICK_INTERVAL = 0.125
+
+# Waveform bar colour by height (0..60 px): blue for quiet, green for loud
+_COLOR_LUT = [
+    (0.22 + (h / 60.0) * (0.20 - 0.22),
+     0.55 + (h / 60.0) * (0.78 - 0.55),
+     0.98 + (h / 60.0) * (0.35 - 0.98),
+     1)
+    for h in range(61)
+]
+
+_PRIVACY_CAPTION = ('Privacy Mode: Processing locally only\n'
+                    'AI summaries disabled')
 
 class _WaveformWidget(Widget):
     """Simple vertical-bar audio waveform visualisation."""
@@ -45,46 +66,62 @@ class _WaveformWidget(Widget):
     NUM_BARS = 18
     BAR_WIDTH = 14
     BAR_SPACING = 6
+    NUM_FRAMES = 64  # pre-generated random frames cycled while active
 
     def __init__(self, **kwargs):
         kwargs.setdefault('size_hint', (1, None))
         kwargs.setdefault('height', 60)
         super().__init__(**kwargs)
         self._levels = [2] * self.NUM_BARS
+        self._idle_levels = self._levels
+        # One batched RNG call, sliced into NUM_FRAMES rows of NUM_BARS
+        n = self.NUM_BARS
+        flat = random.choices(range(4, 56), k=n * self.NUM_FRAMES)
+        self._frames = [flat[i:i + n] for i in range(0, len(flat), n)]
+        self._frame_idx = 0
         self._active = False
-        self.bind(pos=self._draw, size=self._draw)
+        # Bar instructions are created once and mutated in _draw
+        self._bars = []
+        with self.canvas:
+            for _ in range(self.NUM_BARS):
+                color = Color(0.22, 0.55, 0.98, 1)
+                rect = RoundedRectangle(
+                    pos=self.pos, size=(self.BAR_WIDTH, 2), radius=[3])
+                self._bars.append((color, rect))
+        self._rects = [rect for _color, rect in self._bars]
+        self.bind(pos=self._layout, size=self._layout)
 
     def set_active(self, active: bool):
         self._active = active
 
     def update_levels(self, levels=None):
+        if self.parent is None or self.opacity == 0:
+            return
         if levels:
             self._levels = levels
         elif self._active:
-            self._levels = [random.randint(4, 55) for _ in range(self.NUM_BARS)]
+            self._frame_idx = (self._frame_idx + 1) % self.NUM_FRAMES
+            self._levels = self._frames[self._frame_idx]
         else:
-            self._levels = [2] * self.NUM_BARS
+            self._levels = self._idle_levels
         self._draw()
 
-    def _draw(self, *_args):
-        self.canvas.clear()
-        total_w = self.NUM_BARS * (self.BAR_WIDTH + self.BAR_SPACING)
-        start_x = self.x + (self.width - total_w) / 2
+    def _layout(self, *_args):
+        """Position the bars; only needed when the widget moves or resizes."""
+        step = self.BAR_WIDTH + self.BAR_SPACING
+        start_x = self.x + (self.width - self.NUM_BARS * step) / 2
         base_y = self.y + 2
+        for i, rect in enumerate(self._rects):
+            rect.pos = (start_x + i * step, base_y)
+        self._draw()
 
-        with self.canvas:
-            for i, h in enumerate(self._levels):
-                ratio = h / 60.0
-                r = 0.22 + ratio * (0.20 - 0.22)
-                g = 0.55 + ratio * (0.78 - 0.55)
-                b = 0.98 + ratio * (0.35 - 0.98)
-                Color(r, g, b, 1)
-                bx = start_x + i * (self.BAR_WIDTH + self.BAR_SPACING)
-                RoundedRectangle(
-                    pos=(bx, base_y),
-                    size=(self.BAR_WIDTH, max(2, h)),
-                    radius=[3],
-                )
+    def _draw(self, *_args):
+        if not self.get_parent_window():
+            return
+        bw = self.BAR_WIDTH
+        for (color, rect), h in zip(self._bars, self._levels):
+            color.rgba = _COLOR_LUT[min(60, int(h))]
+            rect.size = (bw, max(2, h))
 
 
 class RecordingScreen(BaseScreen):
@@ -93,9 +130,12 @@ class RecordingScreen(BaseScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.elapsed_seconds = 0
-        self.timer_event = None
-        self.waveform_event = None
+        self._h = self._m = self._s = 0
+        self.tick_event = None
+        self._timer_acc = 0.0
+        self._minimized = False
         self._is_paused = False
+        self._privacy_mode = False
         self._build_ui()
 
     def _build_ui(self):
@@ -192,43 +232,84 @@ class RecordingScreen(BaseScreen):
     def on_enter(self):
         self._is_paused = False
         self.elapsed_seconds = 0
-        self.caption_label.text = 'Listening…'
+        self._h = self._m = self._s = 0
+        self._timer_acc = 0.0
+        self._minimized = False
         self.timer_label.text = '00:00'
         self.waveform.set_active(True)
 
-        self.timer_event = Clock.schedule_interval(self._tick_timer, 1.0)
-        self.waveform_event = Clock.schedule_interval(
-            lambda _dt: self.waveform.update_levels(), 0.1)
-
-        self.status_bar.device_label.text = getattr(self.app, 'device_name', 'MeetingBox')
-        self.status_bar.status_text = 'RECORDING'
-        self.status_bar.status_color = COLORS['red']
-        self.status_bar.start_pulse()
-        self.pause_btn.text = '⏸  PAUSE'
+        self._start_ticking()
+        Window.bind(on_minimize=self._on_window_minimize,
+                    on_restore=self._on_window_restore)
+
+        app = self.app
+        sb = self.status_bar
+        privacy = self._privacy_mode = getattr(app, 'privacy_mode', False)
+        sb.device_name = getattr(app, 'device_name', 'MeetingBox')
+        # Pick the privacy variants up front so each label is written once
+        sb.status_text = self._recording_status()
+        sb.status_color = COLORS['red']
+        sb.start_pulse()
+        set_text(self.pause_btn, '⏸  PAUSE')
+        set_text(self.caption_label,
+                 _PRIVACY_CAPTION if privacy else 'Listening…')
 
-        self._apply_privacy_mode()
         self._load_footer_data()
 
     def on_leave(self):
-        if self.timer_event:
-            self.timer_event.cancel()
-            self.timer_event = None
-        if self.waveform_event:
-            self.waveform_event.cancel()
-            self.waveform_event = None
+        self._stop_ticking()
+        Window.unbind(on_minimize=self._on_window_minimize,
+                      on_restore=self._on_window_restore)
+
+    # ------------------------------------------------------------------
+    # Tick scheduling (timer + waveform share one Clock event)
+    # ------------------------------------------------------------------
+    def _start_ticking(self):
+        if not self.tick_event:
+            self.tick_event = Clock.schedule_interval(self._tick, TICK_INTERVAL)
+
+    def _stop_ticking(self):
+        if self.tick_event:
+            self.tick_event.cancel()
+            self.tick_event = None
+
+    def _tick(self, dt):
+        self._timer_acc += dt
+        while self._timer_acc >= 1.0:
+            self._timer_acc -= 1.0
+            self._tick_timer()
+        if not self._minimized:
+            self.waveform.update_levels()
+
+    def _on_window_minimize(self, *_args):
+        self._minimized = True
+
+    def _on_window_restore(self, *_args):
+        self._minimized = False
 
     # ------------------------------------------------------------------
     # Timer
     # ------------------------------------------------------------------
-    def _tick_timer(self, _dt):
+    def _tick_timer(self):
         self.elapsed_seconds += 1
-        h = self.elapsed_seconds // 3600
-        m = (self.elapsed_seconds % 3600) // 60
-        s = self.elapsed_seconds % 60
+        h, m, sec = self._h, self._m, self._s + 1
+        if sec == 60:
+            sec = 0
+            m += 1
+            if m == 60:
+                m = 0
+                h += 1
+        self._h, self._m, self._s = h, m, sec
+        # Keep counting while hidden, but only touch the label when visible
+        if not self._is_current():
+            return
         if h > 0:
-            self.timer_label.text = f'{h:02d}:{m:02d}:{s:02d}'
+            text = _FMT_LONG(h, m, sec)
         else:
-            self.timer_label.text = f'{m:02d}:{s:02d}'
+            text = _TWO_DIGIT[m] + ':' + _TWO_DIGIT[sec]
+        lbl = self.timer_label
+        if text != lbl.text:
+            lbl.text = text
 
     # ------------------------------------------------------------------
     # Pause / Resume
@@ -241,28 +322,28 @@ class RecordingScreen(BaseScreen):
 
     def on_paused(self):
         self._is_paused = True
-        self.pause_btn.text = '▶  RESUME'
-        self.status_bar.status_text = 'PAUSED'
-        self.status_bar.status_color = COLORS['yellow']
-        self.status_bar.stop_pulse()
-
-        if self.timer_event:
-            self.timer_event.cancel()
-            self.timer_event = None
-
+        sb = self.status_bar
+        set_text(self.pause_btn, '▶  RESUME')
+        sb.status_text = 'PAUSED'
+        sb.status_color = COLORS['yellow']
+        sb.stop_pulse()
+
+        # Draw the flat idle bars once, then stop ticking while paused
+        self._stop_ticking()
         self.waveform.set_active(False)
         self.waveform.update_levels()
-        self.caption_label.text = 'Recording paused'
+        set_text(self.caption_label, 'Recording paused')
 
     def on_resumed(self):
         self._is_paused = False
-        self.pause_btn.text = '⏸  PAUSE'
-        self.status_bar.status_text = 'RECORDING'
-        self.status_bar.status_color = COLORS['red']
-        self.status_bar.start_pulse()
+        sb = self.status_bar
+        set_text(self.pause_btn, '⏸  PAUSE')
+        sb.status_text = self._recording_status()
+        sb.status_color = COLORS['red']
+        sb.start_pulse()
 
-        self.timer_event = Clock.schedule_interval(self._tick_timer, 1.0)
         self.waveform.set_active(True)
+        self._start_ticking()
 
     # ------------------------------------------------------------------
     # Stop
@@ -278,31 +359,28 @@ class RecordingScreen(BaseScreen):
         if self._is_paused:
             return
         count = segment_num + 1
-        self.caption_label.text = f'Listening… ({count} segment{"s" if count != 1 else ""} captured)'
+        set_text(
+            self.caption_label,
+            f'Listening… ({count} segment{"s" if count != 1 else ""} captured)')
 
     # ------------------------------------------------------------------
     # Privacy
     # ------------------------------------------------------------------
-    def _apply_privacy_mode(self):
-        privacy = getattr(self.app, 'privacy_mode', False)
-        if privacy:
-            self.status_bar.status_text = 'RECORDING (Privacy)'
-            self.caption_label.text = (
-                'Privacy Mode: Processing locally only\n'
-                'AI summaries disabled')
+    def _recording_status(self):
+        return 'RECORDING (Privacy)' if self._privacy_mode else 'RECORDING'
 
     # ------------------------------------------------------------------
     def _load_footer_data(self):
-        async def _fetch():
-            try:
-                info = await self.backend.get_system_info()
-                free_gb = (info['storage_total'] - info['storage_used']) / (1024 ** 3)
-                wifi_ok = bool(info.get('wifi_ssid'))
-                privacy = getattr(self.app, 'privacy_mode', False)
-                Clock.schedule_once(
-                    lambda _dt: self.update_footer(
-                        wifi_ok=wifi_ok, free_gb=free_gb,
-                        privacy_mode=privacy), 0)
-            except Exception:
-                pass
-        run_async(_fetch())
+        # Home has just fetched system info, so the app cache is normally
+        # warm; only hit the backend if it has expired
+        info = self.app.get_cached_system_info()
+        if info is not None:
+            self._apply_footer(info)
+            return
+        run_async_then(self.app.get_system_info(), self._apply_footer)
+
+    def _apply_footer(self, info):
+        self.update_footer(
+            wifi_ok=bool(info.get('wifi_ssid')),
+            free_gb=info['storage_free_gb'],
+            privacy_mode=self._privacy_mode)
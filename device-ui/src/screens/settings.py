@@ -5,25 +5,33 @@ PRD §5.11 – Sections: DEVICE, NETWORK, STORAGE, SYSTEM,
 PRIVACY, DISPLAY, AUDIO, INTEGRATIONS, MAINTENANCE, SUPPORT.
 """
 
+import asyncio
+
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.gridlayout import GridLayout
-from kivy.uix.label import Label
 from kivy.uix.widget import Widget
 from kivy.clock import Clock
 from async_helper import run_async
+from ui_helper import WrapLabel, set_text
 
 from screens.base_screen import BaseScreen
 from components.status_bar import StatusBar
 from components.settings_item import SettingsItem
 from components.modal_dialog import ModalDialog
 from config import (COLORS, FONT_SIZES, SPACING, DEVICE_MODEL,
-                    DASHBOARD_URL)
+                    DASHBOARD_URL, SYSTEM_INFO_FRESH_TTL)
+
+_AUTO_DELETE_LABELS = {'never': 'Never', '30': 'After 30 days',
+                       '60': 'After 60 days', '90': 'After 90 days'}
+_BRIGHTNESS_LABELS = {'low': 'Low', 'medium': 'Medium', 'high': 'High'}
+_TIMEOUT_LABELS = {'never': 'Never', '5': 'After 5 min',
+                   '10': 'After 10 min'}
 
 
 def _section_header(text):
     """Create an uppercase gray section header label."""
-    lbl = Label(
+    lbl = WrapLabel(
         text=text,
         font_size=FONT_SIZES['small'],
         bold=True,
@@ -34,16 +42,130 @@ def _section_header(text):
         height=28,
         padding=[16, 0],
     )
-    lbl.bind(size=lbl.setter('text_size'))
     return lbl
 
 
+def _format_system_info(info):
+    """Turn a get_system_info() payload into the strings the rows show."""
+    wifi_ssid = info.get('wifi_ssid', 'N/A')
+    ip = info.get('ip_address', '?')
+    mc = info.get('meetings_count', 0)
+    serial = info.get('serial_number', 'MB-00000000')
+
+    return {
+        'wifi': f"{wifi_ssid}  {info['wifi_bars']}\nIP: {ip}",
+        'storage': f"{info['storage_str']}\n{mc} meetings",
+        'firmware': info.get('firmware_version', '?'),
+        'model': f'{DEVICE_MODEL}\nSerial: {serial}',
+        'uptime': info['uptime_str'],
+        'device_name': info.get('device_name', 'MeetingBox'),
+        'wifi_ok': bool(info.get('wifi_ssid')),
+        'free_gb': info['storage_free_gb'],
+    }
+
+
 class SettingsScreen(BaseScreen):
     """Scrollable settings screen – PRD §5.11."""
 
+    # Most boots never open Settings, so its ~30 rows are only built the
+    # first time it is shown
+    LAZY_UI = True
+
+    # Rows in display order: ('header', text) or
+    # ('item', attribute name, SettingsItem kwargs, action) where action is
+    # None, the name of a handler method, or ('goto', screen name).
+    _LAYOUT = (
+        ('header', 'DEVICE'),
+        ('item', 'device_name_item',
+         dict(title='Device Name', subtitle='MeetingBox', mode='arrow'),
+         '_show_device_name_dialog'),
+        ('item', 'model_item',
+         dict(title='Model / Serial',
+              subtitle=f'{DEVICE_MODEL}\nSerial: Loading…',
+              mode='info', height=70),
+         None),
+
+        ('header', 'NETWORK'),
+        ('item', 'wifi_item',
+         dict(title='WiFi', subtitle='Loading…', mode='arrow'),
+         ('goto', 'wifi')),
+
+        ('header', 'STORAGE'),
+        ('item', 'storage_item',
+         dict(title='Storage', subtitle='Loading…', mode='info'),
+         None),
+        ('item', 'auto_delete_item',
+         dict(title='Auto-delete old meetings', subtitle='Never',
+              mode='arrow'),
+         ('goto', 'auto_delete_picker')),
+
+        ('header', 'SYSTEM'),
+        ('item', 'firmware_item',
+         dict(title='Firmware Version', subtitle='Loading…', mode='info'),
+         None),
+        ('item', 'update_item',
+         dict(title='Check for Updates', subtitle='', mode='arrow'),
+         ('goto', 'update_check')),
+        ('item', 'uptime_item',
+         dict(title='Uptime', subtitle='Loading…', mode='info'),
+         None),
+
+        ('header', 'PRIVACY'),
+        ('item', 'privacy_item',
+         dict(title='Privacy Mode',
+              subtitle='All processing happens locally',
+              mode='toggle', active=False),
+         '_on_privacy_toggled'),
+        ('item', 'auto_record_item',
+         dict(title='Auto-start from calendar',
+              subtitle='Start recording when a meeting is scheduled',
+              mode='toggle', active=False),
+         '_on_auto_record_toggled'),
+
+        ('header', 'DISPLAY'),
+        ('item', 'brightness_item',
+         dict(title='Screen Brightness', subtitle='High', mode='arrow'),
+         ('goto', 'brightness_picker')),
+        ('item', 'timeout_item',
+         dict(title='Screen Timeout', subtitle='Never', mode='arrow'),
+         ('goto', 'timeout_picker')),
+
+        ('header', 'AUDIO'),
+        ('item', 'mic_test_item',
+         dict(title='Microphone Test', subtitle='', mode='arrow'),
+         ('goto', 'mic_test')),
+
+        ('header', 'INTEGRATIONS'),
+        ('item', 'gmail_item',
+         dict(title='Gmail', subtitle=f'Configure at {DASHBOARD_URL}',
+              mode='info'),
+         None),
+        ('item', 'calendar_item',
+         dict(title='Calendar', subtitle=f'Configure at {DASHBOARD_URL}',
+              mode='info'),
+         None),
+
+        ('header', 'MAINTENANCE'),
+        ('item', 'restart_item',
+         dict(title='Restart Device', subtitle='', mode='arrow'),
+         '_show_restart_dialog'),
+        ('item', 'reset_item',
+         dict(title='Factory Reset', subtitle='', mode='arrow'),
+         '_show_factory_reset_dialog'),
+
+        ('header', 'SUPPORT'),
+        ('item', 'support_item',
+         dict(title='Help', subtitle='support.meetingbox.com', mode='info'),
+         None),
+    )
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._build_ui()
+        self._dialogs = {}
+        self._sysinfo_task = None
+        # Toggle writes waiting for the in-flight one (asyncio thread only)
+        self._pending_settings = {}
+        self._saving_settings = False
 
     def _build_ui(self):
         root = BoxLayout(orientation='vertical')
@@ -68,179 +190,7 @@ class SettingsScreen(BaseScreen):
             size_hint_y=None,
         )
         self.container.bind(minimum_height=self.container.setter('height'))
-
-        # ---- DEVICE ----
-        self.container.add_widget(_section_header('DEVICE'))
-
-        self.device_name_item = SettingsItem(
-            title='Device Name',
-            subtitle='MeetingBox',
-            mode='arrow',
-            on_press=lambda _: self._show_device_name_dialog(),
-        )
-        self.container.add_widget(self.device_name_item)
-
-        self.model_item = SettingsItem(
-            title='Model / Serial',
-            subtitle=f'{DEVICE_MODEL}\nSerial: Loading…',
-            mode='info',
-        )
-        self.model_item.height = 70
-        self.container.add_widget(self.model_item)
-
-        # ---- NETWORK ----
-        self.container.add_widget(_section_header('NETWORK'))
-
-        self.wifi_item = SettingsItem(
-            title='WiFi',
-            subtitle='Loading…',
-            mode='arrow',
-            on_press=lambda _: self.goto('wifi', transition='slide_left'),
-        )
-        self.container.add_widget(self.wifi_item)
-
-        # ---- STORAGE ----
-        self.container.add_widget(_section_header('STORAGE'))
-
-        self.storage_item = SettingsItem(
-            title='Storage',
-            subtitle='Loading…',
-            mode='info',
-        )
-        self.container.add_widget(self.storage_item)
-
-        self.auto_delete_item = SettingsItem(
-            title='Auto-delete old meetings',
-            subtitle='Never',
-            mode='arrow',
-            on_press=lambda _: self.goto('auto_delete_picker', transition='slide_left'),
-        )
-        self.container.add_widget(self.auto_delete_item)
-
-        # ---- SYSTEM ----
-        self.container.add_widget(_section_header('SYSTEM'))
-
-        self.firmware_item = SettingsItem(
-            title='Firmware Version',
-            subtitle='Loading…',
-            mode='info',
-        )
-        self.container.add_widget(self.firmware_item)
-
-        self.update_item = SettingsItem(
-            title='Check for Updates',
-            subtitle='',
-            mode='arrow',
-            on_press=lambda _: self.goto('update_check', transition='slide_left'),
-        )
-        self.container.add_widget(self.update_item)
-
-        self.uptime_item = SettingsItem(
-            title='Uptime',
-            subtitle='Loading…',
-            mode='info',
-        )
-        self.container.add_widget(self.uptime_item)
-
-        # ---- PRIVACY ----
-        self.container.add_widget(_section_header('PRIVACY'))
-
-        self.privacy_item = SettingsItem(
-            title='Privacy Mode',
-            subtitle='All processing happens locally',
-            mode='toggle',
-            active=False,
-            on_toggle=self._on_privacy_toggled,
-        )
-        self.container.add_widget(self.privacy_item)
-
-        self.auto_record_item = SettingsItem(
-            title='Auto-start from calendar',
-            subtitle='Start recording when a meeting is scheduled',
-            mode='toggle',
-            active=False,
-            on_toggle=self._on_auto_record_toggled,
-        )
-        self.container.add_widget(self.auto_record_item)
-
-        # ---- DISPLAY ----
-        self.container.add_widget(_section_header('DISPLAY'))
-
-        self.brightness_item = SettingsItem(
-            title='Screen Brightness',
-            subtitle='High',
-            mode='arrow',
-            on_press=lambda _: self.goto('brightness_picker', transition='slide_left'),
-        )
-        self.container.add_widget(self.brightness_item)
-
-        self.timeout_item = SettingsItem(
-            title='Screen Timeout',
-            subtitle='Never',
-            mode='arrow',
-            on_press=lambda _: self.goto('timeout_picker', transition='slide_left'),
-        )
-        self.container.add_widget(self.timeout_item)
-
-        # ---- AUDIO ----
-        self.container.add_widget(_section_header('AUDIO'))
-
-        self.mic_test_item = SettingsItem(
-            title='Microphone Test',
-            subtitle='',
-            mode='arrow',
-            on_press=lambda _: self.goto('mic_test', transition='slide_left'),
-        )
-        self.container.add_widget(self.mic_test_item)
-
-        # ---- INTEGRATIONS ----
-        self.container.add_widget(_section_header('INTEGRATIONS'))
-
-        self.gmail_item = SettingsItem(
-            title='Gmail',
-            subtitle=f'Configure at {DASHBOARD_URL}',
-            mode='info',
-        )
-        self.container.add_widget(self.gmail_item)
-
-        self.calendar_item = SettingsItem(
-            title='Calendar',
-            subtitle=f'Configure at {DASHBOARD_URL}',
-            mode='info',
-        )
-        self.container.add_widget(self.calendar_item)
-
-        # ---- MAINTENANCE ----
-        self.container.add_widget(_section_header('MAINTENANCE'))
-
-        self.restart_item = SettingsItem(
-            title='Restart Device',
-            subtitle='',
-            mode='arrow',
-            on_press=lambda _: self._show_restart_dialog(),
-        )
-        self.container.add_widget(self.restart_item)
-
-        self.reset_item = SettingsItem(
-            title='Factory Reset',
-            subtitle='',
-            mode='arrow',
-            on_press=lambda _: self._show_factory_reset_dialog(),
-        )
-        self.container.add_widget(self.reset_item)
-
-        # ---- SUPPORT ----
-        self.container.add_widget(_section_header('SUPPORT'))
-
-        self.support_item = SettingsItem(
-            title='Help',
-            subtitle='support.meetingbox.com',
-            mode='info',
-        )
-        self.container.add_widget(self.support_item)
-
-        # Bottom padding
-        self.container.add_widget(Widget(size_hint_y=None, height=20))
+        self._build_rows()
 
         scroll.add_widget(self.container)
         root.add_widget(scroll)
@@ -251,89 +201,138 @@ class SettingsScreen(BaseScreen):
 
         self.add_widget(root)
 
+    def _build_rows(self):
+        """Create the settings rows from _LAYOUT."""
+        for row in self._LAYOUT:
+            if row[0] == 'header':
+                self.container.add_widget(_section_header(row[1]))
+                continue
+            _, attr, spec, action = row
+            kwargs = dict(spec)
+            if isinstance(action, tuple):
+                kwargs['target_screen'] = action[1]
+                kwargs['on_press'] = self._on_arrow
+            elif action is not None:
+                key = 'on_toggle' if spec['mode'] == 'toggle' else 'on_press'
+                kwargs[key] = getattr(self, action)
+            item = SettingsItem(**kwargs)
+            setattr(self, attr, item)
+            self.container.add_widget(item)
+
+        # Bottom padding
+        self.container.add_widget(Widget(size_hint_y=None, height=20))
+
+    def _on_arrow(self, item):
+        """Shared on_press for rows that just open another screen."""
+        self.goto(item.target_screen, transition='slide_left')
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
-    def on_enter(self):
-        self._load_system_info()
+    def on_pre_enter(self):
+        super().on_pre_enter()
         # Sync privacy and auto_record toggles from app state
         privacy = getattr(self.app, 'privacy_mode', False)
         self.privacy_item.toggle.active = privacy
         auto_record = getattr(self.app, 'auto_record', False)
         self.auto_record_item.toggle.active = auto_record
 
+    def on_enter(self):
+        self._load_system_info()
+
+    def on_leave(self):
+        if self._sysinfo_task:
+            self._sysinfo_task.cancel()
+            self._sysinfo_task = None
+
     # ------------------------------------------------------------------
     # Data
     # ------------------------------------------------------------------
     def _load_system_info(self):
+        # Show the app's cached info straight away; the fetch below only
+        # reaches the backend once that cache is older than a few seconds.
+        cached = self.app.get_cached_system_info(SYSTEM_INFO_FRESH_TTL)
+        if cached is not None:
+            self._apply_system_info(_format_system_info(cached))
+
         async def _fetch():
-            try:
-                info = await self.backend.get_system_info()
-
-                wifi_ssid = info.get('wifi_ssid', 'N/A')
-                sig = info.get('wifi_signal', 0)
-                bars = '▂▄▆█'[:max(1, sig // 25)]
-                ip = info.get('ip_address', '?')
-                wifi_text = f'{wifi_ssid}  {bars}\nIP: {ip}'
-
-                su = info.get('storage_used', 0) / (1024 ** 3)
-                st = info.get('storage_total', 1) / (1024 ** 3)
-                sf = st - su
-                mc = info.get('meetings_count', 0)
-                storage_text = f'{su:.0f}/{st:.0f}GB used · {sf:.0f}GB free\n{mc} meetings'
-
-                fw = info.get('firmware_version', '?')
-                serial = info.get('serial_number', 'MB-00000000')
-                up_s = info.get('uptime', 0)
-                up_d = up_s // 86400
-                up_h = (up_s % 86400) // 3600
-
-                settings = await self.backend.get_settings()
-                ad = settings.get('auto_delete_days', 'never')
-                ad_labels = {'never': 'Never', '30': 'After 30 days',
-                             '60': 'After 60 days', '90': 'After 90 days'}
-                br = settings.get('brightness', 'high')
-                br_labels = {'low': 'Low', 'medium': 'Medium', 'high': 'High'}
-                to = settings.get('screen_timeout', 'never')
-                to_labels = {'never': 'Never', '5': 'After 5 min',
-                             '10': 'After 10 min'}
+            # Independent endpoints – wait for the slowest, not the sum
+            info, settings, updates = await asyncio.gather(
+                self.app.get_system_info(SYSTEM_INFO_FRESH_TTL),
+                self.backend.get_settings(),
+                self.backend.check_for_updates(),
+                return_exceptions=True)
+            texts = (None if isinstance(info, Exception)
+                     else _format_system_info(info))
+
+            def _update(_dt):
+                if not self._is_current():
+                    return
+                if texts is not None:
+                    self._apply_system_info(texts)
+                if not isinstance(settings, Exception):
+                    self._apply_settings(settings)
+                if not isinstance(updates, Exception):
+                    self._apply_updates(updates)
+
+            Clock.schedule_once(_update, 0)
+
+        self._sysinfo_task = run_async(_fetch())
+        self._load_integrations()
 
-                def _update(_dt):
-                    self.wifi_item.subtitle_label.text = wifi_text
-                    self.storage_item.subtitle_label.text = storage_text
-                    self.firmware_item.subtitle_label.text = fw
-                    self.model_item.subtitle_label.text = (
-                        f'{DEVICE_MODEL}\nSerial: {serial}')
-                    self.uptime_item.subtitle_label.text = f'{up_d}d {up_h}h'
-                    name = info.get('device_name', 'MeetingBox')
-                    self.device_name_item.subtitle_label.text = name
-                    self.app.device_name = name
-
-                    self.auto_delete_item.subtitle_label.text = ad_labels.get(ad, ad)
-                    self.brightness_item.subtitle_label.text = br_labels.get(br, br)
-                    self.timeout_item.subtitle_label.text = to_labels.get(to, to)
-
-                    auto_rec = settings.get('auto_record', False)
-                    self.app.auto_record = auto_rec
-                    self.auto_record_item.toggle.active = auto_rec
-
-                    wifi_ok = bool(info.get('wifi_ssid'))
-                    privacy = getattr(self.app, 'privacy_mode', False)
-                    self.update_footer(wifi_ok=wifi_ok, free_gb=sf,
-                                       privacy_mode=privacy)
+    def _apply_system_info(self, texts):
+        set_text(self.wifi_item.subtitle_label, texts['wifi'])
+        set_text(self.storage_item.subtitle_label, texts['storage'])
+        set_text(self.firmware_item.subtitle_label, texts['firmware'])
+        set_text(self.model_item.subtitle_label, texts['model'])
+        set_text(self.uptime_item.subtitle_label, texts['uptime'])
+        name = texts['device_name']
+        set_text(self.device_name_item.subtitle_label, name)
+        self.app.device_name = name
 
-                Clock.schedule_once(_update, 0)
-            except Exception:
-                pass
+        privacy = getattr(self.app, 'privacy_mode', False)
+        self.update_footer(wifi_ok=texts['wifi_ok'], free_gb=texts['free_gb'],
+                           privacy_mode=privacy)
+
+    def _apply_settings(self, settings):
+        ad = settings.get('auto_delete_days', 'never')
+        br = settings.get('brightness', 'high')
+        to = settings.get('screen_timeout', 'never')
+        set_text(self.auto_delete_item.subtitle_label,
+                 _AUTO_DELETE_LABELS.get(ad, ad))
+        set_text(self.brightness_item.subtitle_label,
+                 _BRIGHTNESS_LABELS.get(br, br))
+        set_text(self.timeout_item.subtitle_label,
+                 _TIMEOUT_LABELS.get(to, to))
+
+        auto_rec = settings.get('auto_record', False)
+        self.app.auto_record = auto_rec
+        self.auto_record_item.toggle.active = auto_rec
+
+    def _apply_updates(self, updates):
+        if updates.get('update_available'):
+            new = updates.get('latest_version', '?')
+            set_text(self.update_item.subtitle_label, f'v{new} available')
+        else:
+            set_text(self.update_item.subtitle_label, 'Up to date')
 
-        run_async(_fetch())
-        self._load_integrations()
+    # ------------------------------------------------------------------
+    # Dialogs
+    # ------------------------------------------------------------------
+    def _show_dialog(self, key, **kwargs):
+        """Show a static ModalDialog, building it only on first use."""
+        dialog = self._dialogs.get(key)
+        if dialog is None:
+            dialog = self._dialogs[key] = ModalDialog(**kwargs)
+        if dialog.parent is None:
+            self.add_widget(dialog)
 
     # ------------------------------------------------------------------
     # Device name info dialog
     # ------------------------------------------------------------------
-    def _show_device_name_dialog(self):
-        dialog = ModalDialog(
+    def _show_device_name_dialog(self, _inst=None):
+        self._show_dialog(
+            'device_name',
             title='Device Name',
             message=(f'To change your device name,\n'
                      f'visit {DASHBOARD_URL} on your\n'
@@ -341,7 +340,6 @@ class SettingsScreen(BaseScreen):
             confirm_text='OK',
             cancel_text='',
         )
-        self.add_widget(dialog)
 
     # ------------------------------------------------------------------
     # Integrations
@@ -379,36 +377,48 @@ class SettingsScreen(BaseScreen):
     # ------------------------------------------------------------------
     def _on_privacy_toggled(self, active):
         self.app.privacy_mode = active
-        async def _save():
-            try:
-                await self.backend.update_settings({'privacy_mode': active})
-            except Exception:
-                pass
-        run_async(_save())
+        run_async(self._save_setting('privacy_mode', active))
 
     def _on_auto_record_toggled(self, active):
         self.app.auto_record = active
-        async def _save():
-            try:
-                await self.backend.update_settings({'auto_record': active})
-            except Exception:
-                pass
-        run_async(_save())
+        run_async(self._save_setting('auto_record', active))
+
+    async def _save_setting(self, key, value):
+        """Queue a settings write; runs on the asyncio loop thread.
+
+        Only one update_settings call is in flight at a time. Toggles made
+        meanwhile are merged into the next PATCH, so rapid taps can't
+        reach the backend out of order and the last state always wins.
+        """
+        self._pending_settings[key] = value
+        if self._saving_settings:
+            return
+        self._saving_settings = True
+        try:
+            while self._pending_settings:
+                batch, self._pending_settings = self._pending_settings, {}
+                try:
+                    await self.backend.update_settings(batch)
+                except Exception:
+                    pass
+        finally:
+            self._saving_settings = False
 
     # ------------------------------------------------------------------
     # Restart dialog
     # ------------------------------------------------------------------
-    def _show_restart_dialog(self):
-        dialog = ModalDialog(
+    def _show_restart_dialog(self, _inst=None):
+        self._show_dialog(
+            'restart',
             title='Restart Device?',
             message='The device will restart and be ready\nto use again in about 30 seconds.',
             confirm_text='RESTART',
             cancel_text='CANCEL',
             on_confirm=self._do_restart,
         )
-        self.add_widget(dialog)
 
     def _do_restart(self):
+        self.app.invalidate_system_info()
         async def _restart():
             try:
                 await self.backend.update_settings({'action': 'restart'})
@@ -419,8 +429,9 @@ class SettingsScreen(BaseScreen):
     # ------------------------------------------------------------------
     # Factory reset dialog
     # ------------------------------------------------------------------
-    def _show_factory_reset_dialog(self):
-        dialog = ModalDialog(
+    def _show_factory_reset_dialog(self, _inst=None):
+        self._show_dialog(
+            'factory_reset',
             title='⚠  Factory Reset',
             message=('This will permanently delete:\n'
                      '• All recordings and transcripts\n'
@@ -433,11 +444,11 @@ class SettingsScreen(BaseScreen):
             border_color=COLORS['red'],
             on_confirm=self._do_factory_reset,
         )
-        self.add_widget(dialog)
 
     def _do_factory_reset(self):
         # Second confirmation
-        dialog2 = ModalDialog(
+        self._show_dialog(
+            'factory_reset_confirm',
             title='Final Confirmation',
             message='Reset to factory settings?\nThis cannot be undone.',
             confirm_text='YES, RESET',
@@ -445,9 +456,9 @@ class SettingsScreen(BaseScreen):
             danger=True,
             on_confirm=self._execute_factory_reset,
         )
-        self.add_widget(dialog2)
 
     def _execute_factory_reset(self):
+        self.app.invalidate_system_info()
         async def _reset():
             try:
                 await self.backend.update_settings({'action': 'factory_reset'})
@@ -13,8 +13,12 @@ from kivy.uix.widget import Widget
 from kivy.clock import Clock
 
 from screens.base_screen import BaseScreen
+from ui_helper import WrapLabel
 from config import COLORS, FONT_SIZES
 
+# Opacity of the inactive progress dots
+_DIM_OPACITY = 0.3
+
 
 class SetupProgressScreen(BaseScreen):
     """Setup in progress – waiting for web setup completion."""
@@ -31,43 +35,54 @@ class SetupProgressScreen(BaseScreen):
 
         root.add_widget(Widget(size_hint=(1, 0.25)))
 
-        msg1 = Label(
+        msg1 = WrapLabel(
             text='Setting up your MeetingBox...',
             font_size=FONT_SIZES['medium'],
             color=COLORS['white'],
             halign='center',
             size_hint=(1, None), height=28,
         )
-        msg1.bind(size=msg1.setter('text_size'))
         root.add_widget(msg1)
 
-        self.status_label = Label(
+        self.status_label = WrapLabel(
             text='Waiting for WiFi configuration',
             font_size=FONT_SIZES['body'],
             color=COLORS['gray_400'],
             halign='center',
             size_hint=(1, None), height=28,
         )
-        self.status_label.bind(size=self.status_label.setter('text_size'))
         root.add_widget(self.status_label)
 
         root.add_widget(Widget(size_hint=(1, 0.15)))
 
-        self.dots_label = Label(
-            text='●  ○  ○',
-            font_size=FONT_SIZES['large'],
-            color=COLORS['gray_500'],
-            halign='center',
-            size_hint=(1, None), height=30,
+        # Three fixed dots; the animation only changes their opacity so
+        # no label text is re-rendered per tick.
+        dots_row = BoxLayout(
+            orientation='horizontal',
+            size_hint=(None, None), size=(90, 30),
+            pos_hint={'center_x': 0.5},
         )
-        root.add_widget(self.dots_label)
+        self._dots = []
+        for i in range(3):
+            dot = Label(
+                text='●',
+                font_size=FONT_SIZES['large'],
+                color=COLORS['gray_500'],
+                opacity=1 if i == 0 else _DIM_OPACITY,
+            )
+            dots_row.add_widget(dot)
+            self._dots.append(dot)
+        root.add_widget(dots_row)
 
         root.add_widget(Widget(size_hint=(1, 0.35)))
         self.add_widget(root)
 
     # ------------------------------------------------------------------
     def on_enter(self):
+        for dot in self._dots:
+            dot.opacity = _DIM_OPACITY
         self._dot_index = 0
+        self._dots[0].opacity = 1
         self._dot_event = Clock.schedule_interval(self._animate_dots, 0.5)
 
     def on_leave(self):
@@ -76,7 +91,8 @@ class SetupProgressScreen(BaseScreen):
             self._dot_event = None
 
     def _animate_dots(self, _dt):
+        if not self._is_current():
+            return
+        self._dots[self._dot_index].opacity = _DIM_OPACITY
         self._dot_index = (self._dot_index + 1) % 3
-        dots = ['○', '○', '○']
-        dots[self._dot_index] = '●'
-        self.dots_label.text = '  '.join(dots)
+        self._dots[self._dot_index].opacity = 1
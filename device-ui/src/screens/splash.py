@@ -11,7 +11,6 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.graphics import Color, Rectangle
 from kivy.animation import Animation
-from kivy.clock import Clock
 
 from screens.base_screen import BaseScreen
 from config import COLORS, FONT_SIZES, SPLASH_DURATION
@@ -52,18 +51,18 @@ class SplashScreen(BaseScreen):
 
     # ------------------------------------------------------------------
     def on_enter(self):
-        # Fade-in animation
+        # Fade in, hold, then auto-advance – one animation, one callback
         self.logo_label.opacity = 0
-        anim = Animation(opacity=1, duration=0.5)
+        anim = (Animation(opacity=1, duration=0.5)
+                + Animation(duration=max(0, SPLASH_DURATION - 0.5)))
+        anim.bind(on_complete=self._advance)
         anim.start(self.logo_label)
 
-        # Auto-advance after SPLASH_DURATION
-        Clock.schedule_once(self._advance, SPLASH_DURATION)
-
     def on_leave(self):
-        Clock.unschedule(self._advance)
+        # Cancelling does not fire on_complete
+        Animation.cancel_all(self.logo_label)
 
-    def _advance(self, _dt):
+    def _advance(self, *_args):
         """Move to next screen based on setup state."""
         if self.app.needs_setup():
             self.goto('welcome', transition='fade')
@@ -7,22 +7,39 @@ Displays system information with update button.
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.scrollview import ScrollView
+from kivy.uix.widget import Widget
 from kivy.clock import Clock
-from async_helper import run_async
+from async_helper import run_async_then
+from ui_helper import set_text
 
 from screens.base_screen import BaseScreen
 from components.status_bar import StatusBar
 from components.button import PrimaryButton
-from config import COLORS, FONT_SIZES, SPACING
+from config import (COLORS, FONT_SIZES, SCREEN_PADDING, BUTTON_SPACING,
+                    SECTION_SPACING, SYSTEM_INFO_FRESH_TTL)
+
+# (key, default) pairs read from get_system_info(), in unpack order
+_INFO_FIELDS = (
+    ('device_name', '?'), ('ip_address', '?'), ('wifi_ssid', 'N/A'),
+    ('wifi_bars', ''), ('storage_short', '?'), ('meetings_count', 0),
+    ('firmware_version', '?'), ('uptime_str', '?'),
+)
 
 
 class SystemScreen(BaseScreen):
     """System info – dark theme."""
 
+    LAZY_UI = True
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.system_info = {}
-        self._build_ui()
+        self._last_fields = None
+        self._static_key = None
+        self._static_lines = None
+        # Results land via the Clock; a trigger collapses several arrivals
+        # in one frame into a single _populate
+        self._trigger_populate = Clock.create_trigger(self._populate, 0)
 
     def _build_ui(self):
         root = BoxLayout(orientation='vertical')
@@ -39,8 +56,8 @@ class SystemScreen(BaseScreen):
 
         content = BoxLayout(
             orientation='horizontal',
-            padding=SPACING['screen_padding'],
-            spacing=SPACING['section_spacing'],
+            padding=SCREEN_PADDING,
+            spacing=SECTION_SPACING,
         )
 
         scroll = ScrollView(size_hint=(0.65, 1), do_scroll_x=False)
@@ -57,8 +74,7 @@ class SystemScreen(BaseScreen):
         content.add_widget(scroll)
 
         right = BoxLayout(orientation='vertical', size_hint=(0.35, 1),
-                          spacing=SPACING['button_spacing'])
-        from kivy.uix.widget import Widget
+                          spacing=BUTTON_SPACING)
         right.add_widget(Widget(size_hint=(1, 0.5)))
         self.update_btn = PrimaryButton(
             text='CHECK\nUPDATES', size_hint=(1, 0.4))
@@ -77,37 +93,48 @@ class SystemScreen(BaseScreen):
         self._load_info()
 
     def _load_info(self):
-        async def _load():
-            try:
-                info = await self.backend.get_system_info()
-                self.system_info = info
-                Clock.schedule_once(lambda _: self._populate(), 0)
-            except Exception:
-                pass
-        run_async(_load())
-
-    def _populate(self):
+        # Fresh enough app-level cache – no round-trip at all
+        cached = self.app.get_cached_system_info(SYSTEM_INFO_FRESH_TTL)
+        if cached is not None:
+            self.system_info = cached
+            self._populate()
+            return
+
+        run_async_then(self.app.get_system_info(SYSTEM_INFO_FRESH_TTL),
+                       self._on_info)
+
+    def _on_info(self, info):
+        self.system_info = info
+        self._trigger_populate()
+
+    def _populate(self, _dt=None):
         if not self.system_info:
             return
-        i = self.system_info
-        su = i.get('storage_used', 0) / (1024**3)
-        st = i.get('storage_total', 1) / (1024**3)
-        sf = st - su
-        up_s = i.get('uptime', 0)
-        up_d = up_s // 86400
-        up_h = (up_s % 86400) // 3600
-        sig = i.get('wifi_signal', 0)
-        bars = '▂▄▆█'[:max(1, sig // 25)]
-
-        self.info_label.text = (
-            f"Name: {i.get('device_name', '?')}\n"
-            f"IP: {i.get('ip_address', '?')}\n"
-            f"WiFi: {i.get('wifi_ssid', 'N/A')} {bars}\n"
-            f"Storage: {su:.0f}/{st:.0f}GB ({sf:.0f}GB free)\n"
-            f"Meetings: {i.get('meetings_count', 0)}\n"
-            f"Firmware: {i.get('firmware_version', '?')}\n"
-            f"Uptime: {up_d}d {up_h}h"
-        )
+        get = self.system_info.get
+        fields = tuple(get(k, d) for k, d in _INFO_FIELDS)
+        # Nothing changed since the last enter – keep the current texture
+        if fields == self._last_fields:
+            return
+        self._last_fields = fields
+        name, ip, ssid, bars, storage, mc, fw, uptime = fields
+
+        # Name / IP / firmware almost never change – format them once
+        static_key = (name, ip, fw)
+        if static_key != self._static_key:
+            self._static_key = static_key
+            self._static_lines = (f'Name: {name}', f'IP: {ip}',
+                                  f'Firmware: {fw}')
+        name_line, ip_line, fw_line = self._static_lines
+
+        set_text(self.info_label, '\n'.join((
+            name_line,
+            ip_line,
+            f'WiFi: {ssid} {bars}',
+            f'Storage: {storage}',
+            f'Meetings: {mc}',
+            fw_line,
+            f'Uptime: {uptime}',
+        )))
 
     def _on_update(self, _inst):
         self.goto('update_check', transition='slide_left')
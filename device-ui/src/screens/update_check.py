@@ -4,25 +4,38 @@ Check for Updates Screen – PRD §5.16
 States: Checking → Up to Date OR Update Available
 """
 
+import time
+
 from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.label import Label
 from kivy.uix.widget import Widget
-from kivy.clock import Clock
-from async_helper import run_async
+from async_helper import run_async_then
+from ui_helper import set_color
 
 from screens.base_screen import BaseScreen
 from components.button import PrimaryButton
 from components.status_bar import StatusBar
-from config import COLORS, FONT_SIZES, SPACING
+from config import COLORS, FONT_SIZES, SPACING, UPDATE_CHECK_TTL
+
+# state -> (title text, colour key); the set of outcomes is fixed
+_TITLES = {
+    'checking': ('Checking for updates…', 'white'),
+    'available': ('Update Available!', 'blue'),
+    'current': ("You're Up to Date!", 'white'),
+    'error': ('Check Failed', 'white'),
+}
 
 
 class UpdateCheckScreen(BaseScreen):
     """Check for updates screen – PRD §5.16."""
 
+    LAZY_UI = True
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._update_info = None
-        self._build_ui()
+        self._checked_at = 0.0
 
     def _build_ui(self):
         root = BoxLayout(orientation='vertical')
@@ -50,16 +63,24 @@ class UpdateCheckScreen(BaseScreen):
         )
         root.add_widget(self.icon_label)
 
-        # Title
-        self.title_label = Label(
-            text='Checking for updates…',
-            font_size=FONT_SIZES['large'],
-            bold=True,
-            color=COLORS['white'],
-            halign='center',
-            size_hint=(1, None), height=30,
-        )
-        root.add_widget(self.title_label)
+        # Title – one Label per outcome, stacked; switching state only
+        # flips opacity so each title texture is rendered exactly once
+        title_box = FloatLayout(size_hint=(1, None), height=30)
+        self._titles = {}
+        for state, (text, color) in _TITLES.items():
+            label = Label(
+                text=text,
+                font_size=FONT_SIZES['large'],
+                bold=True,
+                color=COLORS[color],
+                halign='center',
+                pos_hint={'x': 0, 'y': 0},
+                opacity=0,
+            )
+            self._titles[state] = label
+            title_box.add_widget(label)
+        self._titles['checking'].opacity = 1
+        root.add_widget(title_box)
 
         # Details
         self.detail_label = Label(
@@ -98,28 +119,32 @@ class UpdateCheckScreen(BaseScreen):
 
     # ------------------------------------------------------------------
     def on_enter(self):
+        # Back within a few seconds – the last answer is still good
+        if (self._update_info is not None
+                and time.monotonic() - self._checked_at < UPDATE_CHECK_TTL):
+            self._show_result(self._update_info)
+            return
         self.icon_label.text = ''
-        self.title_label.text = 'Checking for updates…'
+        self._show_title('checking')
         self.detail_label.text = ''
         self.install_btn.opacity = 0
         self.install_btn.disabled = True
         self._check_updates()
 
     def _check_updates(self):
-        async def _check():
-            try:
-                result = await self.backend.check_for_updates()
-                self._update_info = result
-                Clock.schedule_once(lambda _dt: self._show_result(result), 0)
-            except Exception:
-                Clock.schedule_once(lambda _dt: self._show_error(), 0)
-        run_async(_check())
+        run_async_then(self.backend.check_for_updates(),
+                       self._on_checked,
+                       lambda _exc: self._show_error())
+
+    def _on_checked(self, result):
+        self._update_info = result
+        self._checked_at = time.monotonic()
+        self._show_result(result)
 
     def _show_result(self, result):
         if result.get('update_available'):
             self.icon_label.text = ''
-            self.title_label.text = 'Update Available!'
-            self.title_label.color = COLORS['blue']
+            self._show_title('available')
             cur = result.get('current_version', '?')
             new = result.get('latest_version', '?')
             notes = result.get('release_notes', '')
@@ -131,16 +156,19 @@ class UpdateCheckScreen(BaseScreen):
             self.install_btn.disabled = False
         else:
             self.icon_label.text = '✓'
-            self.icon_label.color = COLORS['green']
-            self.title_label.text = "You're Up to Date!"
-            self.title_label.color = COLORS['white']
+            set_color(self.icon_label, COLORS['green'])
+            self._show_title('current')
             cur = result.get('current_version', '?')
             self.detail_label.text = f'Current version: {cur}\nLast checked: Just now'
 
+    def _show_title(self, state):
+        for key, label in self._titles.items():
+            label.opacity = 1 if key == state else 0
+
     def _show_error(self):
         self.icon_label.text = '⚠'
-        self.icon_label.color = COLORS['yellow']
-        self.title_label.text = 'Check Failed'
+        set_color(self.icon_label, COLORS['yellow'])
+        self._show_title('error')
         self.detail_label.text = 'Could not check for updates.\nPlease try again later.'
 
     def _on_install(self, _inst):
@@ -9,7 +9,8 @@ from kivy.uix.label import Label
 from kivy.uix.widget import Widget
 from kivy.uix.progressbar import ProgressBar
 from kivy.clock import Clock
-from async_helper import run_async
+from async_helper import run_async_then
+from ui_helper import set_text
 
 from screens.base_screen import BaseScreen
 from components.status_bar import StatusBar
@@ -19,9 +20,16 @@ from config import COLORS, FONT_SIZES, SPACING
 class UpdateInstallScreen(BaseScreen):
     """Firmware update installation screen – PRD §5.17."""
 
+    LAZY_UI = True
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._build_ui()
+        # Latest (progress, stage, eta) from the WebSocket; applied at most
+        # once per frame by _flush_progress
+        self._pending_progress = None
+        self._trigger_flush = Clock.create_trigger(self._flush_progress, 0)
+        self._last_progress = None
+        self._last_eta_bucket = None
 
     def _build_ui(self):
         root = BoxLayout(orientation='vertical')
@@ -114,27 +122,36 @@ class UpdateInstallScreen(BaseScreen):
         self.progress_bar.value = 0
         self.pct_label.text = '0%'
         self.stage_label.text = 'Downloading update files'
+        self._last_progress = 0
+        self._last_eta_bucket = None
         self._start_install()
 
     def _start_install(self):
-        async def _install():
-            try:
-                await self.backend.install_update()
-            except Exception:
-                Clock.schedule_once(
-                    lambda _dt: self.app.show_error_screen(
-                        'Update Failed',
-                        'Could not install firmware update.'), 0)
-        run_async(_install())
+        run_async_then(self.backend.install_update(),
+                       on_error=lambda _exc: self.app.show_error_screen(
+                           'Update Failed',
+                           'Could not install firmware update.'))
 
     # Called from main app via WebSocket events
     def on_progress_update(self, progress: int, stage: str = '', eta: int = 0):
-        self.progress_bar.value = progress
-        self.pct_label.text = f'{progress}%'
+        if not self._ui_built:
+            return
+        self._pending_progress = (progress, stage, eta)
+        self._trigger_flush()
+
+    def _flush_progress(self, _dt):
+        progress, stage, eta = self._pending_progress
+        if progress != self._last_progress:
+            self._last_progress = progress
+            self.progress_bar.value = progress
+            self.pct_label.text = f'{progress}%'
         if stage:
-            self.stage_label.text = stage
+            set_text(self.stage_label, stage)
         if eta:
-            if eta < 60:
-                self.eta_label.text = 'Estimated time: less than 1 minute'
-            else:
-                self.eta_label.text = f'Estimated time: {eta // 60} minutes'
+            bucket = eta // 60
+            if bucket != self._last_eta_bucket:
+                self._last_eta_bucket = bucket
+                if bucket == 0:
+                    self.eta_label.text = 'Estimated time: less than 1 minute'
+                else:
+                    self.eta_label.text = f'Estimated time: {bucket} minutes'
@@ -12,8 +12,9 @@ from kivy.uix.widget import Widget
 from kivy.graphics import Color, Rectangle
 
 from screens.base_screen import BaseScreen
+from ui_helper import WrapLabel
 from components.button import PrimaryButton
-from config import COLORS, FONT_SIZES, SPACING
+from config import COLORS, FONT_SIZES, SCREEN_PADDING
 
 
 class WelcomeScreen(BaseScreen):
@@ -24,7 +25,7 @@ class WelcomeScreen(BaseScreen):
         self._build_ui()
 
     def _build_ui(self):
-        root = BoxLayout(orientation='vertical', padding=[SPACING['screen_padding'], 0])
+        root = BoxLayout(orientation='vertical', padding=[SCREEN_PADDING, 0])
         self.make_dark_bg(root)
 
         # Top spacer
@@ -44,7 +45,7 @@ class WelcomeScreen(BaseScreen):
         root.add_widget(logo)
 
         # Title
-        title = Label(
+        title = WrapLabel(
             text='Welcome to MeetingBox AI!',
             font_size=FONT_SIZES['large'],
             bold=True,
@@ -53,11 +54,10 @@ class WelcomeScreen(BaseScreen):
             height=36,
             halign='center',
         )
-        title.bind(size=title.setter('text_size'))
         root.add_widget(title)
 
         # Subtitle
-        subtitle = Label(
+        subtitle = WrapLabel(
             text="First, let's connect to your WiFi",
             font_size=FONT_SIZES['body'],
             color=COLORS['gray_500'],
@@ -65,7 +65,6 @@ class WelcomeScreen(BaseScreen):
             height=28,
             halign='center',
         )
-        subtitle.bind(size=subtitle.setter('text_size'))
         root.add_widget(subtitle)
 
         # Spacer
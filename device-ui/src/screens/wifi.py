@@ -5,28 +5,38 @@ Compact network list with scan button.
 """
 
 from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
+from kivy.uix.widget import Widget
+from kivy.graphics import Color, RoundedRectangle, Rectangle
 from kivy.clock import Clock
-from async_helper import run_async
+from async_helper import run_async_then
 
 from screens.base_screen import BaseScreen
 from components.status_bar import StatusBar
 from components.wifi_network_item import WiFiNetworkItem
 from components.button import SecondaryButton, PrimaryButton
 from components.modal_dialog import ModalDialog
-from config import COLORS, FONT_SIZES, SPACING, BORDER_RADIUS
+from config import (COLORS, FONT_SIZES, SCREEN_PADDING, BUTTON_SPACING,
+                    SECTION_SPACING, LIST_ITEM_SPACING, BORDER_RADIUS)
 
 
 class WiFiScreen(BaseScreen):
     """WiFi settings – dark theme."""
 
+    LAZY_UI = True
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.networks = []
-        self._build_ui()
+        # ssid -> WiFiNetworkItem rows from the last populate
+        self._items = {}
+        # Results land via the Clock; a trigger collapses several arrivals
+        # in one frame into a single _populate
+        self._trigger_populate = Clock.create_trigger(self._populate, 0)
 
     def _build_ui(self):
         root = BoxLayout(orientation='vertical')
@@ -43,11 +53,11 @@ class WiFiScreen(BaseScreen):
 
         content = BoxLayout(
             orientation='horizontal',
-            padding=SPACING['screen_padding'],
-            spacing=SPACING['section_spacing'],
+            padding=SCREEN_PADDING,
+            spacing=SECTION_SPACING,
         )
 
-        left = BoxLayout(orientation='vertical', size_hint=(0.7, 1), spacing=SPACING['button_spacing'])
+        left = BoxLayout(orientation='vertical', size_hint=(0.7, 1), spacing=BUTTON_SPACING)
 
         self.current_label = Label(
             text='Current: Loading…',
@@ -60,7 +70,7 @@ class WiFiScreen(BaseScreen):
 
         scroll = ScrollView(do_scroll_x=False)
         self.networks_container = GridLayout(
-            cols=1, spacing=SPACING['list_item_spacing'], size_hint_y=None)
+            cols=1, spacing=LIST_ITEM_SPACING, size_hint_y=None)
         self.networks_container.bind(
             minimum_height=self.networks_container.setter('height'))
         scroll.add_widget(self.networks_container)
@@ -69,8 +79,7 @@ class WiFiScreen(BaseScreen):
         content.add_widget(left)
 
         right = BoxLayout(orientation='vertical', size_hint=(0.3, 1),
-                          spacing=SPACING['button_spacing'])
-        from kivy.uix.widget import Widget
+                          spacing=BUTTON_SPACING)
         right.add_widget(Widget(size_hint=(1, 0.6)))
         scan_btn = SecondaryButton(text='SCAN', size_hint=(1, 0.35))
         scan_btn.bind(on_press=lambda _: self._load_networks())
@@ -88,23 +97,40 @@ class WiFiScreen(BaseScreen):
         self._load_networks()
 
     def _load_networks(self):
-        async def _load():
-            try:
-                nets = await self.backend.get_wifi_networks()
-                self.networks = nets
-                Clock.schedule_once(lambda _: self._populate(), 0)
-            except Exception:
-                pass
-        run_async(_load())
-
-    def _populate(self):
-        self.networks_container.clear_widgets()
-        current = next((n for n in self.networks if n.get('connected')), None)
-        self.current_label.text = f"Current: {current['ssid']}" if current else 'Not connected'
+        run_async_then(self.backend.get_wifi_networks(), self._on_networks)
+
+    def _on_networks(self, nets):
+        self.networks = nets
+        self._trigger_populate()
+
+    def _populate(self, _dt=None):
+        # Reuse rows from the previous scan (matched by SSID) so a rescan
+        # where only signal strength moved doesn't rebuild every widget
+        pool = self._items
+        self._items = {}
+        current = None
+        items = []
         for net in self.networks:
-            item = WiFiNetworkItem(network=net)
-            item.bind(on_press=self._on_network)
-            self.networks_container.add_widget(item)
+            if current is None and net.get('connected'):
+                current = net
+            ssid = net['ssid']
+            reusable = pool.get(ssid)
+            if reusable:
+                item = reusable.pop()
+                item.set_network(net)
+            else:
+                item = WiFiNetworkItem(network=net)
+                item.bind(on_press=self._on_network)
+            self._items.setdefault(ssid, []).append(item)
+            items.append(item)
+
+        # Kivy keeps children in reverse order
+        shown = self.networks_container.children[::-1]
+        if len(shown) != len(items) or any(a is not b for a, b in zip(shown, items)):
+            self.networks_container.clear_widgets()
+            for item in items:
+                self.networks_container.add_widget(item)
+        self.current_label.text = f"Current: {current['ssid']}" if current else 'Not connected'
 
     def _on_network(self, instance):
         if instance.network.get('connected'):
@@ -117,8 +143,6 @@ class WiFiScreen(BaseScreen):
             self._connect_to_network(net['ssid'], password=None)
 
     def _show_password_dialog(self, ssid):
-        from kivy.uix.floatlayout import FloatLayout
-        from kivy.graphics import Color, RoundedRectangle, Rectangle
 
         overlay = FloatLayout()
         with overlay.canvas.before:
@@ -172,7 +196,7 @@ class WiFiScreen(BaseScreen):
         )
         card.add_widget(pwd_input)
 
-        btn_row = BoxLayout(size_hint=(1, None), height=50, spacing=SPACING['button_spacing'])
+        btn_row = BoxLayout(size_hint=(1, None), height=50, spacing=BUTTON_SPACING)
         cancel_btn = SecondaryButton(text='CANCEL', size_hint=(0.5, 1))
         connect_btn = PrimaryButton(text='CONNECT', size_hint=(0.5, 1))
 
@@ -195,11 +219,9 @@ class WiFiScreen(BaseScreen):
         self.add_widget(overlay)
 
     def _connect_to_network(self, ssid, password=None):
-        async def _connect():
-            try:
-                result = await self.backend.connect_wifi(ssid, password=password)
-                if result.get('status') == 'connected':
-                    Clock.schedule_once(lambda _: self._load_networks(), 0)
-            except Exception:
-                pass
-        run_async(_connect())
+        run_async_then(self.backend.connect_wifi(ssid, password=password),
+                       self._on_connect_result)
+
+    def _on_connect_result(self, result):
+        if result.get('status') == 'connected':
+            self._load_networks()
@@ -13,50 +13,81 @@ Auto-advances to 'all_set' when the .setup_complete marker appears
 """
 
 import subprocess
+import time
 from pathlib import Path
 
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
-from kivy.uix.image import Image
 from kivy.uix.widget import Widget
 from kivy.graphics import Color, Rectangle
 from kivy.clock import Clock
+from ui_helper import WrapLabel, qr_image
 
 from screens.base_screen import BaseScreen
 from config import (COLORS, FONT_SIZES, SPACING,
                     HOTSPOT_SSID_PREFIX, HOTSPOT_IP, SETUP_URL)
 
-try:
-    import qrcode
-    from io import BytesIO
-    from kivy.core.image import Image as CoreImage
-    HAS_QRCODE = True
-except ImportError:
-    HAS_QRCODE = False
+
+# hotspot.sh status is a bash fork; the SSID doesn't change between visits
+_SSID_TTL = 30
+_ssid_cache = {'value': None, 'ts': 0.0}
+# MAC-derived fallback name, read from sysfs once
+_mac_ssid = None
+# Written by hotspot.sh on start/stop; the script is only forked without it
+_HOTSPOT_STATUS_FILE = Path("/run/meetingbox/hotspot.status")
 
 
 def _get_hotspot_ssid() -> str:
-    """Read the active hotspot SSID from the system."""
+    """Read the active hotspot SSID from the system (cached for 30 s)."""
+    now = time.monotonic()
+    if (_ssid_cache['value'] is not None
+            and now - _ssid_cache['ts'] < _SSID_TTL):
+        return _ssid_cache['value']
+    ssid = _read_hotspot_ssid()
+    _ssid_cache['value'] = ssid
+    _ssid_cache['ts'] = now
+    return ssid
+
+
+def _read_hotspot_ssid() -> str:
+    # hotspot.sh start/stop mirror their state into the status file; only
+    # fork the script itself when that file isn't there
+    try:
+        parts = _HOTSPOT_STATUS_FILE.read_text().strip().split("|")
+        ssid = parts[1] if parts[0] == "active" and len(parts) >= 2 else None
+    except OSError:
+        ssid = _hotspot_ssid_from_script()
+    return ssid or _fallback_ssid()
+
+
+def _hotspot_ssid_from_script():
     # Try multiple possible locations for the hotspot script
     for script_path in ["/opt/meetingbox/scripts/hotspot.sh",
                         "/home/meetingbox/meetingbox/scripts/hotspot.sh"]:
         try:
             result = subprocess.run(
                 ["bash", script_path, "status"],
-                capture_output=True, text=True, timeout=5,
+                capture_output=True, text=True, timeout=5, check=False,
             )
             parts = result.stdout.strip().split("|")
             if parts[0] == "active" and len(parts) >= 2:
                 return parts[1]
         except Exception:
             continue
+    return None
+
 
-    # Fallback: derive from MAC address
+def _fallback_ssid() -> str:
+    """Derive the hotspot name from the WiFi MAC address."""
+    global _mac_ssid
+    if _mac_ssid is not None:
+        return _mac_ssid
     for iface in ["wlan0", "wlp1s0", "wlp2s0"]:
         try:
             mac = Path(f"/sys/class/net/{iface}/address").read_text().strip()
             suffix = mac.replace(":", "")[-4:].upper()
-            return f"{HOTSPOT_SSID_PREFIX}{suffix}"
+            _mac_ssid = f"{HOTSPOT_SSID_PREFIX}{suffix}"
+            return _mac_ssid
         except Exception:
             continue
 
@@ -66,12 +97,15 @@ def _get_hotspot_ssid() -> str:
 class WiFiSetupScreen(BaseScreen):
     """WiFi setup screen shown during first-time configuration."""
 
+    # Only shown during onboarding – set-up devices never render its
+    # labels or QR texture
+    LAZY_UI = True
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.ssid_label = None
         self._dot_index = 0
         self._dot_event = None
-        self._build_ui()
 
     def _build_ui(self):
         root = BoxLayout(
@@ -88,18 +122,17 @@ class WiFiSetupScreen(BaseScreen):
             spacing=8,
         )
 
-        s1h = Label(
+        s1h = WrapLabel(
             text='1. Connect to WiFi:',
             font_size=FONT_SIZES['body'],
             color=COLORS['white'],
             halign='left', valign='bottom',
             size_hint=(1, None), height=24,
         )
-        s1h.bind(size=s1h.setter('text_size'))
         left.add_widget(s1h)
 
         ssid = _get_hotspot_ssid()
-        self.ssid_label = Label(
+        self.ssid_label = WrapLabel(
             text=f'   {ssid}',
             font_size=FONT_SIZES['medium'],
             bold=True,
@@ -107,32 +140,29 @@ class WiFiSetupScreen(BaseScreen):
             halign='left', valign='top',
             size_hint=(1, None), height=22,
         )
-        self.ssid_label.bind(size=self.ssid_label.setter('text_size'))
         left.add_widget(self.ssid_label)
 
-        hint = Label(
+        hint = WrapLabel(
             text='   (on your phone or laptop)',
             font_size=FONT_SIZES['small'],
             color=COLORS['gray_500'],
             halign='left',
             size_hint=(1, None), height=18,
         )
-        hint.bind(size=hint.setter('text_size'))
         left.add_widget(hint)
 
         left.add_widget(Widget(size_hint=(1, None), height=8))
 
-        s2h = Label(
+        s2h = WrapLabel(
             text='2. Open in browser:',
             font_size=FONT_SIZES['body'],
             color=COLORS['white'],
             halign='left', valign='bottom',
             size_hint=(1, None), height=24,
         )
-        s2h.bind(size=s2h.setter('text_size'))
         left.add_widget(s2h)
 
-        url_label = Label(
+        url_label = WrapLabel(
             text=f'   {SETUP_URL}',
             font_size=FONT_SIZES['medium'],
             bold=True,
@@ -140,40 +170,36 @@ class WiFiSetupScreen(BaseScreen):
             halign='left',
             size_hint=(1, None), height=22,
         )
-        url_label.bind(size=url_label.setter('text_size'))
         left.add_widget(url_label)
 
-        s3h = Label(
+        s3h = WrapLabel(
             text='3. Select your WiFi network',
             font_size=FONT_SIZES['body'],
             color=COLORS['white'],
             halign='left', valign='bottom',
             size_hint=(1, None), height=24,
         )
-        s3h.bind(size=s3h.setter('text_size'))
         left.add_widget(s3h)
 
         left.add_widget(Widget(size_hint=(1, 0.3)))
 
         # Waiting indicator (replaces the old "I'M CONNECTED" button)
-        self.waiting_label = Label(
+        self.waiting_label = WrapLabel(
             text='Waiting for WiFi configuration...',
             font_size=FONT_SIZES['small'],
             color=COLORS['gray_500'],
             halign='left',
             size_hint=(1, None), height=20,
         )
-        self.waiting_label.bind(size=self.waiting_label.setter('text_size'))
         left.add_widget(self.waiting_label)
 
-        self.dots_label = Label(
+        self.dots_label = WrapLabel(
             text='',
             font_size=FONT_SIZES['small'],
             color=COLORS['gray_500'],
             halign='left',
             size_hint=(1, None), height=16,
         )
-        self.dots_label.bind(size=self.dots_label.setter('text_size'))
         left.add_widget(self.dots_label)
 
         left.add_widget(Widget(size_hint=(1, None), height=8))
@@ -211,19 +237,9 @@ class WiFiSetupScreen(BaseScreen):
 
     def _generate_qr(self, url: str):
         """Generate QR code image widget."""
-        if HAS_QRCODE:
-            try:
-                qr = qrcode.QRCode(version=1, box_size=6, border=1)
-                qr.add_data(url)
-                qr.make(fit=True)
-                img = qr.make_image(fill_color='white', back_color='black')
-                buf = BytesIO()
-                img.save(buf, format='PNG')
-                buf.seek(0)
-                core_img = CoreImage(buf, ext='png')
-                return Image(texture=core_img.texture, size_hint=(1, 1))
-            except Exception:
-                pass
+        img = qr_image(url, box_size=6)
+        if img is not None:
+            return img
         lbl = Label(
             text='[QR CODE]',
             font_size=FONT_SIZES['large'],
@@ -0,0 +1,129 @@
+"""
+UI Helper
+
+Small widget utilities shared by screens and components.
+"""
+
+import functools
+import hashlib
+import math
+import os
+
+from kivy.graphics.texture import Texture
+from kivy.uix.image import Image
+from kivy.uix.label import Label
+
+from config import CACHE_DIR
+
+# qrcode is imported on first use only; once the QR bitmaps are cached
+# on disk, later boots never load it.
+_qrcode = None
+
+
+class WrapLabel(Label):
+    """Label whose text_size follows its size, so halign/valign apply.
+
+    Uses the default on_size handler rather than a bound callback.
+    """
+
+    def on_size(self, _inst, size):
+        self.text_size = size
+
+
+def set_text(label, text):
+    """Assign *text* to *label* only if it differs.
+
+    Every Label.text write re-shapes glyphs and re-uploads the texture,
+    even when the string is unchanged.
+    """
+    if label.text != text:
+        label.text = text
+
+
+def set_color(widget, rgba):
+    """Assign *rgba* to *widget*.color only if it differs.
+
+    Kivy stores color as a list, so compare element-wise rather than
+    against the config tuple directly.
+    """
+    if tuple(widget.color) != tuple(rgba):
+        widget.color = rgba
+
+
+def _import_qrcode():
+    """Return the qrcode module, or None if it is not installed."""
+    global _qrcode
+    if _qrcode is None:
+        try:
+            import qrcode
+            _qrcode = qrcode
+        except ImportError:
+            _qrcode = False
+    return _qrcode or None
+
+
+def qr_image(url, box_size):
+    """
+    Return an Image widget with a white-on-black QR code for *url*, or
+    None if it cannot be rendered.
+
+    The texture is built once per (url, box_size) for the process; see
+    _qr_texture for the on-disk cache behind it.
+    """
+    texture = _qr_texture(url, box_size)
+    if texture is None:
+        return None
+    return Image(texture=texture, size_hint=(1, 1))
+
+
+@functools.lru_cache(maxsize=4)
+def _qr_texture(url, box_size):
+    """
+    Build the QR texture for *url* straight from 8-bit luminance pixels.
+    The pixels are written to CACHE_DIR on first use and read from there
+    afterwards; if the cache dir is not writable they stay in memory.
+    """
+    digest = hashlib.md5(f'{url}|{box_size}'.encode()).hexdigest()
+    cache_path = CACHE_DIR / f'qr_{digest}.lum'
+    try:
+        pixels = cache_path.read_bytes()
+    except OSError:
+        pixels = _render_qr(url, box_size)
+        if pixels is None:
+            return None
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            tmp_path.write_bytes(pixels)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # read-only cache dir – keep it in memory only
+
+    side = math.isqrt(len(pixels))
+    texture = Texture.create(size=(side, side), colorfmt='luminance')
+    texture.blit_buffer(pixels, colorfmt='luminance', bufferfmt='ubyte')
+    return texture
+
+
+def _render_qr(url, box_size):
+    """Square luminance bitmap of the QR code for *url*, bottom row first."""
+    qrcode = _import_qrcode()
+    if qrcode is None:
+        return None
+    try:
+        qr = qrcode.QRCode(
+            version=1, box_size=box_size, border=1,
+            error_correction=qrcode.constants.ERROR_CORRECT_L)
+        qr.add_data(url)
+        qr.make(fit=True)
+        matrix = qr.get_matrix()
+    except Exception:
+        return None
+
+    on = b'\xff' * box_size
+    off = b'\x00' * box_size
+    # GL textures start at the bottom, so emit rows bottom-up
+    return b''.join(
+        b''.join(on if dark else off for dark in row) * box_size
+        for row in reversed(matrix)
+    )
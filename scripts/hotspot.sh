@@ -17,6 +17,13 @@ CON_NAME="MeetingBox-Hotspot"
 SSID_PREFIX="MeetingBox-"
 HOTSPOT_IP="192.168.4.1"
 WIFI_IFACE="${WIFI_IFACE:-wlan0}"
+# Mirrors `status` output so readers (device UI) needn't fork this script
+STATUS_FILE="${HOTSPOT_STATUS_FILE:-/run/meetingbox/hotspot.status}"
+
+write_status() {
+    mkdir -p "$(dirname "$STATUS_FILE")" 2>/dev/null || return 0
+    echo "$1" > "${STATUS_FILE}.tmp" 2>/dev/null && mv -f "${STATUS_FILE}.tmp" "$STATUS_FILE" || true
+}
 
 get_suffix() {
     # Use last 4 chars of wlan0 MAC as suffix, or fallback
@@ -63,6 +70,7 @@ EOF
     # Brief wait for AP to stabilise
     sleep 2
 
+    write_status "active|${ssid}|${HOTSPOT_IP}"
     echo "[Hotspot] AP active — SSID: ${ssid}, IP: ${HOTSPOT_IP}"
     echo "[Hotspot] meetingbox.setup → ${HOTSPOT_IP}"
 }
@@ -74,6 +82,7 @@ cmd_stop() {
 
     # Clean up DNS redirect
     rm -f /etc/NetworkManager/dnsmasq-shared.d/meetingbox.conf
+    write_status "inactive"
 
     echo "[Hotspot] AP stopped. WiFi will reconnect to previous network."
 }
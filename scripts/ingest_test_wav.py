@@ -8,6 +8,7 @@ Usage:
   python scripts/ingest_test_wav.py path/to/audio.wav --base http://localhost:8000
 
 Requires: requests (pip install requests)
+Optional: requests-toolbelt, to stream large WAVs instead of buffering them
 """
 
 import argparse
@@ -34,10 +35,31 @@ def main() -> None:
         print("Error: install requests: pip install requests", file=sys.stderr)
         sys.exit(1)
 
+    try:
+        from requests_toolbelt.multipart.encoder import MultipartEncoder
+    except ImportError:
+        MultipartEncoder = None
+
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    # Retry only failed connects – the upload body can't be replayed
+    retry = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.2)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
     url = f"{args.base.rstrip('/')}/api/meetings/test/ingest-wav"
-    with path.open("rb") as f:
-        files = {"file": (path.name, f, "audio/wav")}
-        r = requests.post(url, files=files, timeout=60)
+    with session, path.open("rb") as f:
+        fields = {"file": (path.name, f, "audio/wav")}
+        if MultipartEncoder is not None:
+            # Streams the file in chunks; requests' files= reads it all into memory
+            enc = MultipartEncoder(fields=fields)
+            r = session.post(url, data=enc, headers={"Content-Type": enc.content_type},
+                             timeout=60)
+        else:
+            r = session.post(url, files=fields, timeout=60)
     r.raise_for_status()
     data = r.json()
     print(f"Ingested: session_id={data['session_id']}")
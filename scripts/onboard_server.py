@@ -18,9 +18,12 @@ Flow:
 Run: sudo python3 scripts/onboard_server.py
 """
 
+import gzip
 import http.server
 import json
 import os
+import re
+import signal
 import subprocess
 import sys
 import threading
@@ -31,12 +34,31 @@ LISTEN_PORT = 80
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 SETUP_MARKER = os.path.join(_PROJECT_ROOT, "data", "config", ".setup_complete")
 HOTSPOT_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hotspot.sh")
+MAX_CONNECT_BODY = 4096  # bytes
 WIFI_SWITCH_DELAY = 3  # seconds — gives phone time to receive the response
 
 # Global connection status: idle | connecting | connected | failed
 _wifi_status = {"state": "idle", "message": ""}
 _wifi_status_lock = threading.Lock()
 
+# Requests handled at once. Held only while a request is being served, not
+# for a connection's lifetime, so idle keep-alive sockets never take a slot
+MAX_ACTIVE_REQUESTS = 4
+_request_slots = threading.BoundedSemaphore(MAX_ACTIVE_REQUESTS)
+
+# Latest nmcli scan, refreshed by _scan_loop every SCAN_INTERVAL seconds
+SCAN_INTERVAL = 10
+SCAN_TIMEOUT = 15  # seconds
+# More than the page can usefully list; stop reading nmcli after this
+MAX_SCAN_RESULTS = 50
+_scan_cache = {"data": [], "body": b"[]", "ts": 0.0}
+_scan_lock = threading.Lock()
+
+# nmcli -t separates fields with ':' and backslash-escapes ':' and '\' inside
+# values, so a plain split breaks SSIDs like "Cafe:5G"
+_NMCLI_FIELD = re.compile(r"((?:[^:\\]|\\.)*)(?::|$)")
+_NMCLI_UNESCAPE = re.compile(r"\\(.)")
+
 HTML_PAGE = """<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -164,9 +186,9 @@ HTML_PAGE = """<!DOCTYPE html>
 </div>
 
 <script>
-async function scanNetworks() {
+async function scanNetworks(rescan) {
   try {
-    const res = await fetch('/api/scan');
+    const res = await fetch(rescan ? '/api/scan?rescan=true' : '/api/scan');
     const networks = await res.json();
     const list = document.getElementById('scan-list');
     document.getElementById('scan-loader').classList.remove('active');
@@ -274,7 +296,7 @@ function retrySetup() {
   document.getElementById('connect-btn').disabled = false;
   document.getElementById('connect-btn').textContent = 'Connect';
   document.getElementById('password').value = '';
-  scanNetworks();
+  scanNetworks(true);
 }
 
 function startRedirectCountdown() {
@@ -298,58 +320,307 @@ scanNetworks();
 </html>
 """
 
+# The page is constant – encode and compress it once, not per request
+_HTML_BYTES = HTML_PAGE.encode("utf-8")
+_HTML_GZ = gzip.compress(_HTML_BYTES, 6)
+
+
+def _kill_scan(proc):
+    # nmcli runs in its own session; kill the group so nothing keeps
+    # the stdout pipe open after a timeout or an early stop
+    if proc.poll() is None:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+
+def _scan_networks(rescan="no"):
+    """
+    Return visible networks from nmcli, strongest first, or None if the
+    scan failed or timed out. *rescan* is passed to nmcli's --rescan: "no"
+    reads NetworkManager's own cached list (which it refreshes in the
+    background), "yes" waits for a fresh radio scan.
+    """
+    try:
+        proc = subprocess.Popen(
+            ["nmcli", "-t", "-f", "SSID,SIGNAL,SECURITY", "dev", "wifi", "list",
+             "--rescan", rescan],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1,
+            start_new_session=True,
+        )
+    except Exception as e:
+        print(f"[Onboard] Scan error: {e}", flush=True)
+        return None
+
+    # Parse lines as nmcli writes them; the watchdog stands in for
+    # subprocess.run's timeout
+    expired = threading.Event()
+
+    def _expire():
+        expired.set()
+        _kill_scan(proc)
+
+    watchdog = threading.Timer(SCAN_TIMEOUT, _expire)
+    watchdog.start()
+    networks = []
+    parsed = capped = False
+    try:
+        seen = set()
+        for line in proc.stdout:
+            fields = _NMCLI_FIELD.findall(line.rstrip("\n"))
+            if len(fields) < 3:
+                continue
+            ssid = _NMCLI_UNESCAPE.sub(r"\1", fields[0])
+            if not ssid or ssid in seen or ssid.startswith("MeetingBox-"):
+                continue
+            seen.add(ssid)
+            sig = fields[1]
+            networks.append({
+                "ssid": ssid,
+                "signal": int(sig) if sig.isdigit() else 0,
+                "security": fields[2] or "open",
+            })
+            if len(networks) >= MAX_SCAN_RESULTS:
+                capped = True
+                break
+        parsed = True
+    except Exception as e:
+        print(f"[Onboard] Scan error: {e}", flush=True)
+    finally:
+        # Our own early stop (or a parse error) kills nmcli on purpose
+        if capped or not parsed:
+            _kill_scan(proc)
+        proc.stdout.close()
+        returncode = proc.wait()
+        watchdog.cancel()
+
+    if not parsed:
+        return None
+    if expired.is_set():
+        print(f"[Onboard] Scan timed out after {SCAN_TIMEOUT}s", flush=True)
+        return None
+    if not capped and returncode != 0:
+        print(f"[Onboard] Scan failed: nmcli exited with {returncode}", flush=True)
+        return None
+    networks.sort(key=lambda n: n["signal"], reverse=True)
+    return networks
+
+
+def _refresh_scan(rescan="no"):
+    networks = _scan_networks(rescan)
+    if networks is None:
+        # Keep serving the last good list rather than an empty/partial one
+        return
+    body = json.dumps(networks).encode()
+    with _scan_lock:
+        _scan_cache["data"] = networks
+        _scan_cache["body"] = body
+        _scan_cache["ts"] = time.monotonic()
+
+
+def _scan_loop():
+    """Keep _scan_cache warm so /api/scan never forks nmcli itself."""
+    while True:
+        with _wifi_status_lock:
+            state = _wifi_status["state"]
+        # Leave the radio alone while a connection is being brought up
+        if state != "connecting":
+            _refresh_scan()
+        time.sleep(SCAN_INTERVAL)
+
+
+def _set_failed(message):
+    global _wifi_status
+    with _wifi_status_lock:
+        _wifi_status = {"state": "failed", "message": message}
+
+
+def _save_and_connect(server, ssid, password):
+    """Create the NetworkManager profile for *ssid*, then switch to it."""
+    global _wifi_status
+    print(f"[Onboard] Saving WiFi credentials for: {ssid}", flush=True)
+
+    try:
+        subprocess.run(
+            ["nmcli", "connection", "delete", ssid],
+            capture_output=True, text=True, timeout=10,
+        )
+
+        if password:
+            result = subprocess.run(
+                ["nmcli", "connection", "add",
+                 "type", "wifi",
+                 "ifname", "wlan0",
+                 "con-name", ssid,
+                 "ssid", ssid,
+                 "autoconnect", "yes",
+                 "--",
+                 "wifi-sec.key-mgmt", "wpa-psk",
+                 "wifi-sec.psk", password,
+                 "wifi-sec.psk-flags", "0"],  # store PSK in profile file, not keyring
+                capture_output=True, text=True, timeout=15,
+            )
+        else:
+            result = subprocess.run(
+                ["nmcli", "connection", "add",
+                 "type", "wifi",
+                 "ifname", "wlan0",
+                 "con-name", ssid,
+                 "ssid", ssid,
+                 "autoconnect", "yes"],
+                capture_output=True, text=True, timeout=15,
+            )
+    except Exception as e:
+        print(f"[Onboard] Error: {e}", flush=True)
+        _set_failed(str(e))
+        return
+
+    if result.returncode != 0:
+        msg = result.stderr.strip() or result.stdout.strip() or "Failed to save credentials"
+        print(f"[Onboard] Failed to create profile: {msg}", flush=True)
+        _set_failed(msg)
+        return
+
+    print(f"[Onboard] WiFi profile created for {ssid}", flush=True)
+
+    print(f"[Onboard] Waiting {WIFI_SWITCH_DELAY}s before switching WiFi...", flush=True)
+    time.sleep(WIFI_SWITCH_DELAY)
+
+    print(f"[Onboard] Activating WiFi connection: {ssid}", flush=True)
+    connect_result = subprocess.run(
+        ["nmcli", "connection", "up", ssid],
+        capture_output=True, text=True, timeout=30,
+    )
+
+    if connect_result.returncode == 0:
+        print(f"[Onboard] WiFi connected to {ssid}", flush=True)
+        with _wifi_status_lock:
+            _wifi_status = {"state": "connected", "message": ""}
+
+        os.makedirs(os.path.dirname(SETUP_MARKER), exist_ok=True)
+        fd = os.open(SETUP_MARKER, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, b"1")
+        finally:
+            os.close(fd)
+        print(f"[Onboard] Setup marker written: {SETUP_MARKER}", flush=True)
+
+        subprocess.run(
+            ["bash", HOTSPOT_SCRIPT, "stop"],
+            capture_output=True, text=True, timeout=15,
+        )
+        print("[Onboard] Hotspot stopped", flush=True)
+
+        print("[Onboard] Stopping onboard server...", flush=True)
+        server.shutdown()
+        server.server_close()
+
+        for _attempt in range(10):
+            check = subprocess.run(
+                ["ss", "-tlnp"],
+                capture_output=True, text=True, timeout=5,
+            )
+            if ":80 " not in check.stdout:
+                break
+            time.sleep(1)
+        else:
+            print("[Onboard] WARNING: port 80 still held after 10s", flush=True)
+
+        print("[Onboard] Starting nginx for normal operation...", flush=True)
+        subprocess.run(
+            ["docker", "compose", "up", "-d", "nginx"],
+            capture_output=True, text=True, timeout=60,
+            cwd=_PROJECT_ROOT,
+        )
+        print("[Onboard] Onboarding complete — nginx started", flush=True)
+    else:
+        msg = connect_result.stderr.strip() or "Connection failed"
+        print(f"[Onboard] WiFi activation failed: {msg}", flush=True)
+
+        subprocess.run(
+            ["nmcli", "connection", "delete", ssid],
+            capture_output=True, text=True, timeout=10,
+        )
+
+        print("[Onboard] Restarting hotspot after failed connection...", flush=True)
+        subprocess.run(
+            ["bash", HOTSPOT_SCRIPT, "start"],
+            capture_output=True, text=True, timeout=20,
+        )
+        print("[Onboard] Hotspot restarted — user can retry", flush=True)
+
+        _set_failed("Wrong password or network unreachable. Please try again.")
+
+
+class OnboardServer(http.server.ThreadingHTTPServer):
+    """
+    One thread per connection, so a slow nmcli call doesn't block page
+    loads and idle keep-alive sockets never hold up new requests.
+    OnboardHandler caps how many requests run at once.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 16
+
 
 class OnboardHandler(http.server.BaseHTTPRequestHandler):
+    # Every response carries Content-Length, so the phone can keep one
+    # connection open across page load, scans and status polls
+    protocol_version = "HTTP/1.1"
+    # Small JSON replies – don't let Nagle hold them back
+    disable_nagle_algorithm = True
+    # Drop idle keep-alive or stalled clients instead of pinning a thread
+    timeout = 15
+
+    def address_string(self):
+        return self.client_address[0]
+
     def log_message(self, format, *args):
         print(f"[Onboard] {args[0]}", flush=True)
 
     def do_GET(self):
-        if self.path == "/api/scan":
-            self._handle_scan()
-        elif self.path == "/api/status":
-            self._handle_status()
-        else:
-            self._serve_page()
+        path, _, query = self.path.partition("?")
+        with _request_slots:
+            if path == "/api/scan":
+                self._handle_scan(force="rescan=true" in query)
+            elif path == "/api/status":
+                self._handle_status()
+            else:
+                self._serve_page()
 
     def do_POST(self):
-        if self.path == "/api/connect":
-            self._handle_connect()
-        else:
-            self.send_error(404)
+        with _request_slots:
+            if self.path == "/api/connect":
+                self._handle_connect()
+            else:
+                self.send_error(404)
 
     def _serve_page(self):
+        body = _HTML_BYTES
+        gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+        if gzipped:
+            body = _HTML_GZ
         self.send_response(200)
         self.send_header("Content-Type", "text/html; charset=utf-8")
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Cache-Control", "max-age=60")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(HTML_PAGE.encode())
-
-    def _handle_scan(self):
-        networks = []
-        try:
-            result = subprocess.run(
-                ["nmcli", "-t", "-f", "SSID,SIGNAL,SECURITY", "dev", "wifi", "list"],
-                capture_output=True, text=True, timeout=15,
-            )
-            seen = set()
-            for line in result.stdout.strip().splitlines():
-                parts = line.split(":")
-                if len(parts) >= 3 and parts[0] and parts[0] not in seen:
-                    if parts[0].startswith("MeetingBox-"):
-                        continue
-                    seen.add(parts[0])
-                    networks.append({
-                        "ssid": parts[0],
-                        "signal": int(parts[1]) if parts[1].isdigit() else 0,
-                        "security": parts[2] or "open",
-                    })
-            networks.sort(key=lambda n: n["signal"], reverse=True)
-        except Exception as e:
-            print(f"[Onboard] Scan error: {e}", flush=True)
-
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps(networks).encode())
+        self.wfile.write(body)
+
+    def _handle_scan(self, force=False):
+        # ?rescan=true (retry after a failed connect) waits for a fresh
+        # radio scan; otherwise serve the cache, filling it on first use
+        if force:
+            _refresh_scan("yes")
+        elif not _scan_cache["ts"]:
+            _refresh_scan()
+        with _scan_lock:
+            body = _scan_cache["body"]
+        self._send_json_bytes(body)
 
     def _handle_status(self):
         global _wifi_status
@@ -359,8 +630,23 @@ class OnboardHandler(http.server.BaseHTTPRequestHandler):
 
     def _handle_connect(self):
         global _wifi_status
-        length = int(self.headers.get("Content-Length", 0))
-        body = json.loads(self.rfile.read(length)) if length else {}
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            self.send_error(400)
+            return
+        # SSID + password fit easily; refuse anything bigger before reading
+        if length > MAX_CONNECT_BODY:
+            self.send_error(413)
+            return
+        try:
+            body = json.loads(self.rfile.read(length)) if length > 0 else {}
+        except ValueError:
+            self.send_error(400)
+            return
+        if not isinstance(body, dict):
+            self.send_error(400)
+            return
         ssid = body.get("ssid", "")
         password = body.get("password", "")
 
@@ -368,136 +654,26 @@ class OnboardHandler(http.server.BaseHTTPRequestHandler):
             self._json_response({"status": "failed", "message": "No SSID provided"})
             return
 
-        print(f"[Onboard] Saving WiFi credentials for: {ssid}", flush=True)
+        with _wifi_status_lock:
+            _wifi_status = {"state": "connecting", "message": f"Connecting to {ssid}…"}
 
-        try:
-            subprocess.run(
-                ["nmcli", "connection", "delete", ssid],
-                capture_output=True, text=True, timeout=10,
-            )
-
-            if password:
-                result = subprocess.run(
-                    ["nmcli", "connection", "add",
-                     "type", "wifi",
-                     "ifname", "wlan0",
-                     "con-name", ssid,
-                     "ssid", ssid,
-                     "autoconnect", "yes",
-                     "--",
-                     "wifi-sec.key-mgmt", "wpa-psk",
-                     "wifi-sec.psk", password,
-                     "wifi-sec.psk-flags", "0"],  # store PSK in profile file, not keyring
-                    capture_output=True, text=True, timeout=15,
-                )
-            else:
-                result = subprocess.run(
-                    ["nmcli", "connection", "add",
-                     "type", "wifi",
-                     "ifname", "wlan0",
-                     "con-name", ssid,
-                     "ssid", ssid,
-                     "autoconnect", "yes"],
-                    capture_output=True, text=True, timeout=15,
-                )
-
-            if result.returncode != 0:
-                msg = result.stderr.strip() or result.stdout.strip() or "Failed to save credentials"
-                print(f"[Onboard] Failed to create profile: {msg}", flush=True)
-                self._json_response({"status": "failed", "message": msg})
-                return
-
-            print(f"[Onboard] WiFi profile created for {ssid}", flush=True)
-
-            with _wifi_status_lock:
-                _wifi_status = {"state": "connecting", "message": f"Connecting to {ssid}…"}
-
-            self._json_response({"status": "saved", "ssid": ssid})
-
-            def delayed_wifi_switch():
-                global _wifi_status
-                print(f"[Onboard] Waiting {WIFI_SWITCH_DELAY}s before switching WiFi...", flush=True)
-                time.sleep(WIFI_SWITCH_DELAY)
-
-                print(f"[Onboard] Activating WiFi connection: {ssid}", flush=True)
-                connect_result = subprocess.run(
-                    ["nmcli", "connection", "up", ssid],
-                    capture_output=True, text=True, timeout=30,
-                )
-
-                if connect_result.returncode == 0:
-                    print(f"[Onboard] WiFi connected to {ssid}", flush=True)
-                    with _wifi_status_lock:
-                        _wifi_status = {"state": "connected", "message": ""}
-
-                    marker = Path(SETUP_MARKER)
-                    marker.parent.mkdir(parents=True, exist_ok=True)
-                    marker.write_text("1")
-                    print(f"[Onboard] Setup marker written: {SETUP_MARKER}", flush=True)
-
-                    subprocess.run(
-                        ["bash", HOTSPOT_SCRIPT, "stop"],
-                        capture_output=True, text=True, timeout=15,
-                    )
-                    print("[Onboard] Hotspot stopped", flush=True)
-
-                    print("[Onboard] Stopping onboard server...", flush=True)
-                    self.server.shutdown()
-                    self.server.server_close()
-
-                    for _attempt in range(10):
-                        check = subprocess.run(
-                            ["ss", "-tlnp"],
-                            capture_output=True, text=True, timeout=5,
-                        )
-                        if ":80 " not in check.stdout:
-                            break
-                        time.sleep(1)
-                    else:
-                        print("[Onboard] WARNING: port 80 still held after 10s", flush=True)
-
-                    print("[Onboard] Starting nginx for normal operation...", flush=True)
-                    subprocess.run(
-                        ["docker", "compose", "up", "-d", "nginx"],
-                        capture_output=True, text=True, timeout=60,
-                        cwd=_PROJECT_ROOT,
-                    )
-                    print("[Onboard] Onboarding complete — nginx started", flush=True)
-                else:
-                    msg = connect_result.stderr.strip() or "Connection failed"
-                    print(f"[Onboard] WiFi activation failed: {msg}", flush=True)
-
-                    subprocess.run(
-                        ["nmcli", "connection", "delete", ssid],
-                        capture_output=True, text=True, timeout=10,
-                    )
-
-                    print("[Onboard] Restarting hotspot after failed connection...", flush=True)
-                    subprocess.run(
-                        ["bash", HOTSPOT_SCRIPT, "start"],
-                        capture_output=True, text=True, timeout=20,
-                    )
-                    print("[Onboard] Hotspot restarted — user can retry", flush=True)
-
-                    with _wifi_status_lock:
-                        _wifi_status = {
-                            "state": "failed",
-                            "message": "Wrong password or network unreachable. Please try again.",
-                        }
-
-            threading.Thread(target=delayed_wifi_switch, daemon=False).start()
-
-        except Exception as e:
-            print(f"[Onboard] Error: {e}", flush=True)
-            with _wifi_status_lock:
-                _wifi_status = {"state": "failed", "message": str(e)}
-            self._json_response({"status": "failed", "message": str(e)})
+        # Saving the profile and switching networks both run in the
+        # background; the page follows progress through /api/status
+        self._json_response({"status": "saved", "ssid": ssid})
+        threading.Thread(
+            target=_save_and_connect, args=(self.server, ssid, password),
+            daemon=False,
+        ).start()
 
     def _json_response(self, data, code=200):
+        self._send_json_bytes(json.dumps(data).encode(), code)
+
+    def _send_json_bytes(self, body, code=200):
         self.send_response(code)
         self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(body)
 
 
 def main():
@@ -515,12 +691,14 @@ def main():
     print(f"[Onboard] Starting onboarding server on 0.0.0.0:{LISTEN_PORT}", flush=True)
 
     try:
-        server = http.server.HTTPServer(("0.0.0.0", LISTEN_PORT), OnboardHandler)
+        server = OnboardServer(("0.0.0.0", LISTEN_PORT), OnboardHandler)
     except OSError as e:
         print(f"[Onboard] ERROR: Cannot bind to port {LISTEN_PORT}: {e}", flush=True)
         print(f"[Onboard] Is another process using port {LISTEN_PORT}? Check with: sudo ss -tlnp | grep :{LISTEN_PORT}", flush=True)
         sys.exit(1)
 
+    threading.Thread(target=_scan_loop, daemon=True).start()
+
     print(f"[Onboard] READY — listening on http://0.0.0.0:{LISTEN_PORT}", flush=True)
     try:
         server.serve_forever()